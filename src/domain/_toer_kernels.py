@@ -0,0 +1,62 @@
+# src/domain/_toer_kernels.py - Vectorized TOER batch scoring kernels
+
+import numpy as np
+
+# 2**27 + 1, splits a float64 into two halves whose products with small
+# integers are exact (Dekker)
+_SPLITTER = 134217729.0
+
+
+def display_indices(values, scale):
+    """Round values * scale to integers exactly as round(value, 2) would.
+
+    A plain float multiply can land on .5 when the true product is just below
+    or above it, so the product's rounding error is recovered with an exact
+    split and used to break those ties the same way Python's round() does.
+    Works element-wise on a float64 array of finite values.
+    """
+    split = _SPLITTER * values
+    high = split - (split - values)
+    low = values - high
+    a = high * scale
+    b = low * scale
+    product = a + b
+    b_virtual = product - a
+    error = (a - (product - b_virtual)) + (b - b_virtual)
+
+    floor = np.floor(product)
+    fraction = product - floor
+    round_up = (fraction > 0.5) | (
+        (fraction == 0.5) & ((error > 0.0) | ((error == 0.0) & (floor % 2 == 1)))
+    )
+    return floor.astype(np.int64) + round_up
+
+
+def toer_columns(features, table_data, table_offsets, scales):
+    """Score an (n_games, n_metrics) feature matrix against packed lookup tables.
+
+    Column j is scored from table_data[table_offsets[j]:table_offsets[j + 1]],
+    indexed by the value scaled by scales[j], one whole column at a time. Rows
+    holding a value the tables cannot score (out of range, NaN, or a fractional
+    count) come back as NaN so the caller can route them through the scalar path.
+    """
+    n_rows, n_cols = features.shape
+    total = np.zeros(n_rows, np.int64)
+    scored = np.ones(n_rows, dtype=bool)
+    for col in range(n_cols):
+        values = features[:, col]
+        table = table_data[table_offsets[col]:table_offsets[col + 1]]
+        scale = scales[col]
+        in_range = (values >= 0.0) & (values <= (table.size - 1) / scale)
+        safe_values = np.where(in_range, values, 0.0)
+        if scale == 1.0:
+            in_range &= safe_values == np.floor(safe_values)
+            index = safe_values.astype(np.int64)
+        else:
+            index = display_indices(safe_values, scale)
+        scored &= in_range
+        total += table[np.where(in_range, index, 0)]
+
+    toer = np.clip(total, 0, 100).astype(np.float64)
+    toer[~scored] = np.nan
+    return toer
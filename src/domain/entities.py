@@ -202,7 +202,7 @@ class TeamRecord:
                 self.playoff_wins + self.playoff_losses)
 
 
-@dataclass
+@dataclass(frozen=True)
 class PerformanceRank:
     """Performance ranking with context."""
     rank: int
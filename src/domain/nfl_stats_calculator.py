@@ -201,11 +201,13 @@ class NFLStatsCalculator:
                 if game_result.home_team == team.abbreviation:
                     game_stat.offensive_stats = game_result.home_team_offensive_stats
                     game_stat.defensive_stats = game_result.away_team_offensive_stats
-                    logger.debug(f"Game {game_id}: {team.abbreviation} (home) TOER={game_stat.offensive_stats.toer:.1f}, Allowed={game_stat.defensive_stats.toer:.1f}")
+                    logger.debug("Game %s: %s (home) TOER=%.1f, Allowed=%.1f", game_id, team.abbreviation,
+                                 game_stat.offensive_stats.toer, game_stat.defensive_stats.toer)
                 else:
                     game_stat.offensive_stats = game_result.away_team_offensive_stats
                     game_stat.defensive_stats = game_result.home_team_offensive_stats
-                    logger.debug(f"Game {game_id}: {team.abbreviation} (away) TOER={game_stat.offensive_stats.toer:.1f}, Allowed={game_stat.defensive_stats.toer:.1f}")
+                    logger.debug("Game %s: %s (away) TOER=%.1f, Allowed=%.1f", game_id, team.abbreviation,
+                                 game_stat.offensive_stats.toer, game_stat.defensive_stats.toer)
                 
                 game_stats.append(game_stat)
             
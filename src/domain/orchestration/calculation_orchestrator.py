@@ -7,6 +7,7 @@ import pandas as pd
 from ..entities import Team, Season, SeasonStats, GameStats, TeamRecord, GameType
 from ..exceptions import DataNotFoundError
 from ...utils.configuration_utils import apply_configuration_to_data
+from ...utils.season_utils import apply_season_type_filter
 
 logger = logging.getLogger(__name__)
 
@@ -102,13 +103,11 @@ class CalculationOrchestrator:
             # Always get ALL games for team record calculation
             all_games_data = self._league_cache.get_cached_play_data(season.year, 'ALL', configuration or {})
             if all_games_data is not None:
-                complete_team_data = all_games_data[all_games_data['posteam'] == team.abbreviation].copy()
+                complete_team_data = all_games_data[all_games_data['posteam'] == team.abbreviation]
                 
                 team_record = self._statistics_calculator.calculate_team_record(complete_team_data, team.abbreviation)
                 
-                filtered_team_data = complete_team_data.copy()
-                if season_type_filter and season_type_filter != 'ALL':
-                    filtered_team_data = filtered_team_data[filtered_team_data['season_type'] == season_type_filter]
+                filtered_team_data = apply_season_type_filter(complete_team_data, season_type_filter)
                 if configuration:
                     filtered_team_data = apply_configuration_to_data(filtered_team_data, configuration)
                 
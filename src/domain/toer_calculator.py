@@ -12,6 +12,10 @@ import threading
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Callable, Tuple
 
+import numpy as np
+
+from ._toer_kernels import toer_columns
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,9 +38,60 @@ class TOERCalculator:
     
     _config: Optional[Dict[str, Any]] = None
     _scorers: Optional[Dict[str, Callable]] = None
+    _tables: Optional[Dict[str, Tuple[int, ...]]] = None
+    _packed_tables: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+    _perfect_bounds: Optional[Tuple[Tuple[float, float], ...]] = None
+    _component_scorer: Optional[Callable[..., Optional[Tuple[int, ...]]]] = None
     _config_lock = threading.RLock()
     _scorers_lock = threading.RLock()
     
+    # Metrics scored through precomputed lookup tables:
+    # metric -> (largest valid value, index scale). Rate metrics are rounded to
+    # display precision before scoring, so a scale of 100 covers every input;
+    # counts are scored per whole unit.
+    _TABLE_DOMAINS = {
+        'yards_per_play': (20.0, 100),
+        'turnovers': (10.0, 1),
+        'completion_percentage': (100.0, 100),
+        'rush_yards_per_carry': (15.0, 100),
+        'sacks': (15.0, 1),
+        'third_down_percentage': (100.0, 100),
+        'success_rate': (100.0, 100),
+        'first_downs': (50.0, 100),
+        'points_per_drive': (8.0, 100),
+        'redzone_td_percentage': (100.0, 100),
+        'penalty_yards': (300.0, 1),
+    }
+    
+    # calculate_toer input limits in argument order:
+    # (name used in error messages, largest valid value, is a percentage)
+    _INPUT_LIMITS = (
+        ('yards_per_play', 20.0, False),
+        ('turnovers', 10, False),
+        ('completion_percentage', 100.0, True),
+        ('rush_yards_per_carry', 15.0, False),
+        ('sacks', 15, False),
+        ('third_down_percentage', 100.0, True),
+        ('success_rate', 100.0, True),
+        ('first_downs', 50.0, False),
+        ('points_per_drive', 8.0, False),
+        ('redzone_td_percentage', 100.0, True),
+        ('penalty_yards', 300, False),
+    )
+    
+    # Component names for calculate_toer's debug log, in argument order
+    _COMPONENT_KEYS = (
+        'ypp', 'turnovers', 'completion', 'rush_ypc', 'sacks', 'third_down',
+        'success_rate', 'first_downs', 'ppd', 'redzone', 'penalty',
+    )
+    
+    # Feature column order for calculate_toer_batch, matching calculate_toer's arguments
+    _BATCH_METRICS = (
+        'yards_per_play', 'turnovers', 'completion_percentage', 'rush_yards_per_carry',
+        'sacks', 'third_down_percentage', 'success_rate', 'first_downs',
+        'points_per_drive', 'redzone_td_percentage', 'penalty_yards',
+    )
+    
     @classmethod
     def _load_config(cls) -> Dict[str, Any]:
         """Load scoring configuration from YAML file with thread-safe caching."""
@@ -183,13 +238,149 @@ class TOERCalculator:
         
         return cls._scorers
     
+    @classmethod
+    def _build_tables(cls) -> Dict[str, Tuple[int, ...]]:
+        """Precompute score lookup tables for threshold metrics with thread-safe caching.
+        
+        Each table holds the scorer's result for every scaled integer in the
+        metric's valid range, turning a threshold scan into a single index.
+        """
+        # First check without lock for performance
+        if cls._tables is not None:
+            return cls._tables
+        
+        # Double-checked locking pattern for thread safety
+        with cls._scorers_lock:
+            if cls._tables is None:
+                scorers = cls._build_scorers()
+                tables = {}
+                for metric_name, (max_value, scale) in cls._TABLE_DOMAINS.items():
+                    scorer = scorers[metric_name]
+                    tables[metric_name] = tuple(
+                        scorer(i / scale) for i in range(int(max_value * scale) + 1)
+                    )
+                cls._perfect_bounds = cls._derive_perfect_bounds(tables)
+                cls._component_scorer = cls._specialize_component_scorer(tables)
+                cls._tables = tables
+                logger.debug("Built scoring lookup tables")
+        
+        return cls._tables
+    
+    @staticmethod
+    def _specialize_component_scorer(tables: Dict[str, Tuple[int, ...]]) -> Callable[..., Optional[Tuple[int, ...]]]:
+        """Build one function that scores all eleven validated calculate_toer inputs.
+        
+        The tables are bound as closure variables and every lookup is written
+        out inline, so a game is scored in a single call. Rate metrics are
+        rounded to display precision and indexed per hundredth, counts per whole
+        unit, matching _TABLE_DOMAINS. Returns None for NaN rates or fractional
+        counts, which have no direct table slot.
+        """
+        ypp_table = tables['yards_per_play']
+        turnovers_table = tables['turnovers']
+        comp_pct_table = tables['completion_percentage']
+        ypc_table = tables['rush_yards_per_carry']
+        sacks_table = tables['sacks']
+        third_down_table = tables['third_down_percentage']
+        success_rate_table = tables['success_rate']
+        first_downs_table = tables['first_downs']
+        ppd_table = tables['points_per_drive']
+        redzone_table = tables['redzone_td_percentage']
+        penalty_table = tables['penalty_yards']
+        
+        def score_components(ypp, turnovers, comp_pct, ypc, sacks, third_down_pct, success_rate,
+                             first_downs, ppd, redzone_td_pct, penalty_yards):
+            if turnovers % 1 or sacks % 1 or penalty_yards % 1:
+                return None
+            try:
+                return (
+                    ypp_table[int(round(ypp, 2) * 100 + 0.5)],
+                    turnovers_table[int(turnovers)],
+                    comp_pct_table[int(round(comp_pct, 2) * 100 + 0.5)],
+                    ypc_table[int(round(ypc, 2) * 100 + 0.5)],
+                    sacks_table[int(sacks)],
+                    third_down_table[int(round(third_down_pct, 2) * 100 + 0.5)],
+                    success_rate_table[int(round(success_rate, 2) * 100 + 0.5)],
+                    first_downs_table[int(round(first_downs, 2) * 100 + 0.5)],
+                    ppd_table[int(round(ppd, 2) * 100 + 0.5)],
+                    redzone_table[int(round(redzone_td_pct, 2) * 100 + 0.5)],
+                    penalty_table[int(penalty_yards)],
+                )
+            except ValueError:
+                # int() of a NaN rate
+                return None
+        
+        return score_components
+    
+    @classmethod
+    def _derive_perfect_bounds(cls, tables: Dict[str, Tuple[int, ...]]) -> Optional[Tuple[Tuple[float, float], ...]]:
+        """Find, per batch metric, the value range that earns the metric's top score.
+        
+        Returns:
+            (low, high) bounds in calculate_toer argument order, or None when
+            top scores across the board would not reach the 100 cap
+        """
+        bounds = []
+        best_total = 0
+        for metric_name in cls._BATCH_METRICS:
+            table = tables[metric_name]
+            scale = cls._TABLE_DOMAINS[metric_name][1]
+            best = max(table)
+            low = high = table.index(best)
+            while high + 1 < len(table) and table[high + 1] == best:
+                high += 1
+            # Raw inputs inside these bounds also round into the top bucket
+            bounds.append((low / scale, high / scale))
+            best_total += best
+        return tuple(bounds) if best_total >= 100 else None
+    
+    @classmethod
+    def _build_packed_tables(cls) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Pack the lookup tables into flat arrays in batch column order.
+        
+        Returns:
+            Tuple of (concatenated scores, per-column offsets, per-column scales)
+        """
+        # First check without lock for performance
+        if cls._packed_tables is not None:
+            return cls._packed_tables
+        
+        # Double-checked locking pattern for thread safety
+        with cls._scorers_lock:
+            if cls._packed_tables is None:
+                tables = cls._build_tables()
+                columns = [tables[metric_name] for metric_name in cls._BATCH_METRICS]
+                offsets = np.zeros(len(columns) + 1, dtype=np.int64)
+                offsets[1:] = np.cumsum([len(column) for column in columns])
+                table_data = np.concatenate([np.asarray(column, dtype=np.int64) for column in columns])
+                scales = np.array(
+                    [cls._TABLE_DOMAINS[metric_name][1] for metric_name in cls._BATCH_METRICS],
+                    dtype=np.float64
+                )
+                cls._packed_tables = (table_data, offsets, scales)
+        
+        return cls._packed_tables
+    
+    @classmethod
+    def _table_score(cls, metric_name: str, value: float) -> int:
+        """Look up the score for a validated, display-rounded value or whole count."""
+        max_value, scale = cls._TABLE_DOMAINS[metric_name]
+        if not 0 <= value <= max_value or (scale == 1 and value != int(value)):
+            # NaN, out-of-domain values and fractional counts have no table slot
+            return cls._build_scorers()[metric_name](value)
+        return cls._build_tables()[metric_name][int(round(value * scale))]
+    
     @classmethod
     def _clear_cache(cls) -> None:
-        """Clear cached configuration and scorers. Primarily for testing."""
+        """Clear cached configuration, scorers and lookup tables. Primarily for testing."""
         with cls._config_lock:
             with cls._scorers_lock:
                 cls._config = None
                 cls._scorers = None
+                cls._tables = None
+                cls._packed_tables = None
+                cls._perfect_bounds = None
+                cls._component_scorer = None
                 logger.debug("Cleared TOER cache")
     
     @staticmethod
@@ -206,14 +397,31 @@ class TOERCalculator:
         if value < 0 or value > 100:
             raise TOERValidationError(f"{param_name} must be between 0 and 100: {value}")
     
+    @classmethod
+    def _invalid_input_message(cls, values: Tuple[float, ...]) -> Optional[str]:
+        """Check calculate_toer inputs with the scoring methods' own rules.
+        
+        Returns:
+            The validation error a scoring method would raise for the first
+            invalid input, or None when every input is valid
+        """
+        for value, (param_name, max_value, is_percentage) in zip(values, cls._INPUT_LIMITS):
+            if is_percentage:
+                if value < 0 or value > 100:
+                    return f"{param_name} must be between 0 and 100: {value}"
+            elif value < 0:
+                return f"{param_name} cannot be negative: {value}"
+            elif value > max_value:
+                return f"{param_name} seems unrealistic: {value} (max reasonable: {max_value})"
+        return None
+    
     @classmethod
     def calculate_yards_per_play_score(cls, ypp: float) -> int:
         """Calculate YPP component score (0-10 points)."""
         cls._validate_non_negative(ypp, "yards_per_play", 20.0)
         # Round to display precision to ensure consistency between displayed and scored values
-        rounded_ypp = round(ypp, 2)
-        scorers = cls._build_scorers()
-        return scorers['yards_per_play'](rounded_ypp)
+        rounded_ypp = round(float(ypp), 2)
+        return cls._table_score('yards_per_play', rounded_ypp)
     
     @classmethod
     def calculate_turnovers_score(cls, turnovers: int) -> int:
@@ -222,26 +430,23 @@ class TOERCalculator:
             raise TOERValidationError(f"turnovers cannot be negative: {turnovers}")
         if turnovers > 10:
             raise TOERValidationError(f"turnovers seems unrealistic: {turnovers} (max reasonable: 10)")
-        scorers = cls._build_scorers()
-        return scorers['turnovers'](turnovers)
+        return cls._table_score('turnovers', turnovers)
     
     @classmethod
     def calculate_completion_pct_score(cls, comp_pct: float) -> int:
         """Calculate completion percentage component score (0-10 points)."""
         cls._validate_percentage(comp_pct, "completion_percentage")
         # Round to display precision to ensure consistency
-        rounded_comp_pct = round(comp_pct, 2)
-        scorers = cls._build_scorers()
-        return scorers['completion_percentage'](rounded_comp_pct)
+        rounded_comp_pct = round(float(comp_pct), 2)
+        return cls._table_score('completion_percentage', rounded_comp_pct)
     
     @classmethod
     def calculate_rush_ypc_score(cls, ypc: float) -> int:
         """Calculate rushing YPC component score (0-10 points)."""
         cls._validate_non_negative(ypc, "rush_yards_per_carry", 15.0)
         # Round to display precision to ensure consistency
-        rounded_ypc = round(ypc, 2)
-        scorers = cls._build_scorers()
-        return scorers['rush_yards_per_carry'](rounded_ypc)
+        rounded_ypc = round(float(ypc), 2)
+        return cls._table_score('rush_yards_per_carry', rounded_ypc)
     
     @classmethod
     def calculate_sacks_score(cls, sacks: int) -> int:
@@ -250,53 +455,47 @@ class TOERCalculator:
             raise TOERValidationError(f"sacks cannot be negative: {sacks}")
         if sacks > 15:
             raise TOERValidationError(f"sacks seems unrealistic: {sacks} (max reasonable: 15)")
-        scorers = cls._build_scorers()
-        return scorers['sacks'](sacks)
+        return cls._table_score('sacks', sacks)
     
     @classmethod
     def calculate_third_down_score(cls, third_down_pct: float) -> int:
         """Calculate third down conversion component score (0-10 points)."""
         cls._validate_percentage(third_down_pct, "third_down_percentage")
         # Round to display precision to ensure consistency
-        rounded_third_down_pct = round(third_down_pct, 2)
-        scorers = cls._build_scorers()
-        return scorers['third_down_percentage'](rounded_third_down_pct)
+        rounded_third_down_pct = round(float(third_down_pct), 2)
+        return cls._table_score('third_down_percentage', rounded_third_down_pct)
     
     @classmethod
     def calculate_success_rate_score(cls, success_rate: float) -> int:
         """Calculate play success rate component score (0-10 points)."""
         cls._validate_percentage(success_rate, "success_rate")
         # Round to display precision to ensure consistency
-        rounded_success_rate = round(success_rate, 2)
-        scorers = cls._build_scorers()
-        return scorers['success_rate'](rounded_success_rate)
+        rounded_success_rate = round(float(success_rate), 2)
+        return cls._table_score('success_rate', rounded_success_rate)
     
     @classmethod
     def calculate_first_downs_score(cls, first_downs: float) -> int:
         """Calculate first downs component score (0-10 points)."""
         cls._validate_non_negative(first_downs, "first_downs", 50.0)
         # Round to display precision to ensure consistency
-        rounded_first_downs = round(first_downs, 2)
-        scorers = cls._build_scorers()
-        return scorers['first_downs'](rounded_first_downs)
+        rounded_first_downs = round(float(first_downs), 2)
+        return cls._table_score('first_downs', rounded_first_downs)
     
     @classmethod
     def calculate_ppd_score(cls, ppd: float) -> int:
         """Calculate points per drive component score (0-10 points)."""
         cls._validate_non_negative(ppd, "points_per_drive", 8.0)
         # Round to display precision to ensure consistency
-        rounded_ppd = round(ppd, 2)
-        scorers = cls._build_scorers()
-        return scorers['points_per_drive'](rounded_ppd)
+        rounded_ppd = round(float(ppd), 2)
+        return cls._table_score('points_per_drive', rounded_ppd)
     
     @classmethod
     def calculate_redzone_score(cls, redzone_td_pct: float) -> int:
         """Calculate red zone TD percentage component score (0-10 points)."""
         cls._validate_percentage(redzone_td_pct, "redzone_td_percentage")
         # Round to display precision to ensure consistency
-        rounded_redzone_td_pct = round(redzone_td_pct, 2)
-        scorers = cls._build_scorers()
-        return scorers['redzone_td_percentage'](rounded_redzone_td_pct)
+        rounded_redzone_td_pct = round(float(redzone_td_pct), 2)
+        return cls._table_score('redzone_td_percentage', rounded_redzone_td_pct)
     
     @classmethod
     def calculate_penalty_yards_adjustment(cls, penalty_yards: int) -> int:
@@ -305,8 +504,7 @@ class TOERCalculator:
             raise TOERValidationError(f"penalty_yards cannot be negative: {penalty_yards}")
         if penalty_yards > 300:
             raise TOERValidationError(f"penalty_yards seems unrealistic: {penalty_yards} (max reasonable: 300)")
-        scorers = cls._build_scorers()
-        return scorers['penalty_yards'](penalty_yards)
+        return cls._table_score('penalty_yards', penalty_yards)
     
     @classmethod  
     def calculate_toer(cls,
@@ -341,46 +539,109 @@ class TOERCalculator:
             TOER score between 0 and 100
         """
         try:
-            # Calculate component scores
-            scores = {
-                'ypp': cls.calculate_yards_per_play_score(avg_yards_per_play),
-                'turnovers': cls.calculate_turnovers_score(turnovers),
-                'completion': cls.calculate_completion_pct_score(completion_pct),
-                'rush_ypc': cls.calculate_rush_ypc_score(rush_ypc),
-                'sacks': cls.calculate_sacks_score(sacks),
-                'third_down': cls.calculate_third_down_score(third_down_pct),
-                'success_rate': cls.calculate_success_rate_score(success_rate),
-                'first_downs': cls.calculate_first_downs_score(first_downs),
-                'ppd': cls.calculate_ppd_score(points_per_drive),
-                'redzone': cls.calculate_redzone_score(redzone_td_pct),
-                'penalty': cls.calculate_penalty_yards_adjustment(penalty_yards)
-            }
+            # NumPy scalars round half-hundredths differently from Python floats
+            # (round(np.float64(43.995), 2) == 44.0), so score plain floats only
+            values = tuple(map(float, (avg_yards_per_play, turnovers, completion_pct, rush_ypc, sacks,
+                                       third_down_pct, success_rate, first_downs, points_per_drive,
+                                       redzone_td_pct, penalty_yards)))
+            # A game with every metric in its top bucket is capped at 100
+            cls._build_tables()
+            bounds = cls._perfect_bounds
+            if bounds is not None and all(low <= value <= high for value, (low, high) in zip(values, bounds)):
+                return 100.0
             
-            # Calculate total TOER
-            # Base score from first 10 metrics
-            base_score = sum([
-                scores['ypp'],
-                scores['turnovers'],
-                scores['completion'],
-                scores['rush_ypc'],
-                scores['sacks'],
-                scores['third_down'],
-                scores['success_rate'],
-                scores['first_downs'],
-                scores['ppd'],
-                scores['redzone']
-            ])
+            # Validate once up front so invalid games need no exception round-trip
+            error = cls._invalid_input_message(values)
+            if error is not None:
+                logger.error(f"Error calculating TOER: {error}")
+                return 0.0
             
-            # Add penalty adjustment
-            total_score = base_score + scores['penalty']
+            # Score all components in one specialized call; NaN rates and
+            # fractional counts fall back to per-metric table lookups
+            scores = cls._component_scorer(*values)
+            if scores is None:
+                scores = tuple(
+                    cls._table_score(
+                        metric_name,
+                        value if cls._TABLE_DOMAINS[metric_name][1] == 1 else round(value, 2)
+                    )
+                    for metric_name, value in zip(cls._BATCH_METRICS, values)
+                )
+            
+            # Base score from first 10 metrics plus the penalty adjustment
+            base_score = sum(scores[:10])
+            total_score = base_score + scores[10]
             
             # Ensure score is between 0 and 100
             toer = max(0, min(100, total_score))
             
-            logger.debug(f"TOER Calculation - Components: {scores}, Base: {base_score}, Total: {total_score}, Final TOER: {toer}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("TOER Calculation - Components: %s, Base: %s, Total: %s, Final TOER: %s",
+                             dict(zip(cls._COMPONENT_KEYS, scores)), base_score, total_score, toer)
             
             return toer
             
         except Exception as e:
             logger.error(f"Error calculating TOER: {e}")
-            return 0.0
\ No newline at end of file
+            return 0.0
+    
+    @classmethod
+    def calculate_toer_batch(cls, features: np.ndarray) -> np.ndarray:
+        """
+        Calculate TOER for many games in one pass.
+        
+        NumPy scores each metric column against the lookup tables in one vector
+        pass. Games the tables cannot score (invalid or fractional inputs) fall
+        back to calculate_toer. Both paths round display precision the way
+        Python's round() does on floats, so results match calculate_toer
+        exactly, including for NumPy scalar inputs.
+        
+        Args:
+            features: Array of shape (n_games, 11) with columns in calculate_toer
+                argument order (yards per play through penalty yards)
+            
+        Returns:
+            Float array of TOER scores between 0 and 100, one per game
+        """
+        features = np.asarray(features, dtype=np.float64)
+        if features.ndim != 2 or features.shape[1] != len(cls._BATCH_METRICS):
+            raise TOERValidationError(
+                f"features must have shape (n_games, {len(cls._BATCH_METRICS)}): {features.shape}"
+            )
+        
+        toer = toer_columns(features, *cls._build_packed_tables())
+        
+        for row in np.flatnonzero(np.isnan(toer)):
+            toer[row] = cls.calculate_toer(*features[row])
+        return toer
+    
+    @classmethod
+    def calculate_toer_vectorized(cls,
+                                  avg_yards_per_play: np.ndarray,
+                                  turnovers: np.ndarray,
+                                  completion_pct: np.ndarray,
+                                  rush_ypc: np.ndarray,
+                                  sacks: np.ndarray,
+                                  third_down_pct: np.ndarray,
+                                  success_rate: np.ndarray,
+                                  first_downs: np.ndarray,
+                                  points_per_drive: np.ndarray,
+                                  redzone_td_pct: np.ndarray,
+                                  penalty_yards: np.ndarray) -> np.ndarray:
+        """
+        Calculate TOER element-wise over per-metric arrays.
+        
+        Takes the same arguments as calculate_toer as 1-D arrays (scalars
+        broadcast), e.g. DataFrame columns for a whole league-season.
+        Invalid games score 0.0, as they do in calculate_toer.
+        
+        Returns:
+            Float array of TOER scores between 0 and 100, one per game
+        """
+        columns = np.broadcast_arrays(*(
+            np.asarray(values, dtype=np.float64)
+            for values in (avg_yards_per_play, turnovers, completion_pct, rush_ypc, sacks,
+                           third_down_pct, success_rate, first_downs, points_per_drive,
+                           redzone_td_pct, penalty_yards)
+        ))
+        return cls.calculate_toer_batch(np.column_stack(columns))
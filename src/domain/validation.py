@@ -1,11 +1,34 @@
 # src/domain/validation.py - Domain validation rules for NFL data
 
 import re
+import time
+from collections.abc import Mapping
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional
 from ..config import NFL_TEAMS, VALID_TEAMS, NFL_DATA_START_YEAR, SEASON_TYPES
 from .exceptions import DataValidationError
 
+# Team abbreviation format: 2-4 uppercase letters, compiled once at import
+_TEAM_ABBR_RE = re.compile(r'^[A-Z]{2,4}$')
+
+# Lookup sets and error-message listings built once instead of per validation
+_VALID_TEAMS = frozenset(VALID_TEAMS)
+_VALID_SEASON_TYPES = frozenset(SEASON_TYPES)
+_SORTED_TEAMS_STR = ', '.join(sorted(NFL_TEAMS))
+_SORTED_SEASON_TYPES_STR = ', '.join(sorted(SEASON_TYPES))
+
+
+def _latest_valid_season_year() -> int:
+    """Latest accepted season year (one past the current year), re-read at most hourly."""
+    return _latest_valid_season_year_for(int(time.monotonic() // 3600))
+
+
+@lru_cache(maxsize=1)
+def _latest_valid_season_year_for(hour_bucket: int) -> int:
+    """Compute the latest accepted season year; cached per monotonic-clock hour."""
+    return datetime.now().year + 1
+
 
 class NFLValidator:
     """Domain validator for NFL-specific business rules."""
@@ -26,15 +49,13 @@ class NFLValidator:
         except (ValueError, TypeError):
             raise DataValidationError(f"{field_name} must be a valid integer", field_name, season_year)
         
-        current_year = datetime.now().year
-        
         if year < NFL_DATA_START_YEAR:
             raise DataValidationError(
                 f"{field_name} must be {NFL_DATA_START_YEAR} or later (NFL data availability)",
                 field_name, year
             )
         
-        if year > current_year + 1:
+        if year > _latest_valid_season_year():
             raise DataValidationError(
                 f"{field_name} cannot be more than one year in the future",
                 field_name, year
@@ -60,14 +81,13 @@ class NFLValidator:
         normalized = team_abbr.upper().strip()
         
         # Format validation: 2-4 uppercase letters only
-        if not re.match(r'^[A-Z]{2,4}$', normalized):
+        if not _TEAM_ABBR_RE.match(normalized):
             raise DataValidationError(f"{field_name} must be 2-4 uppercase letters only", field_name, normalized)
         
         # Check against valid NFL teams
-        if normalized not in VALID_TEAMS:
-            sorted_teams = sorted(NFL_TEAMS)
+        if normalized not in _VALID_TEAMS:
             raise DataValidationError(
-                f"Invalid team abbreviation: {normalized}. Must be one of: {', '.join(sorted_teams)}",
+                f"Invalid team abbreviation: {normalized}. Must be one of: {_SORTED_TEAMS_STR}",
                 field_name, normalized
             )
         
@@ -88,9 +108,9 @@ class NFLValidator:
         
         normalized = season_type.upper().strip()
         
-        if normalized not in SEASON_TYPES:
+        if normalized not in _VALID_SEASON_TYPES:
             raise DataValidationError(
-                f"Invalid season type: {normalized}. Must be one of: {', '.join(sorted(SEASON_TYPES))}",
+                f"Invalid season type: {normalized}. Must be one of: {_SORTED_SEASON_TYPES_STR}",
                 field_name, normalized
             )
         
@@ -107,11 +127,12 @@ class NFLValidator:
         if config is None:
             raise DataValidationError(f"{field_name} cannot be None", field_name, config)
         
-        if not isinstance(config, dict):
+        # Read-only mappings (e.g. from get_configuration) are accepted and copied into a dict
+        if not isinstance(config, Mapping):
             raise DataValidationError(f"{field_name} must be a dictionary", field_name, config)
         
         # Basic validation for known configuration fields
-        validated_config = config.copy()
+        validated_config = dict(config)
         
         # Validate boolean fields
         boolean_fields = [
@@ -11,7 +11,8 @@ from ...domain.exceptions import CacheError
 from ...domain.entities import Team, Season
 from ...utils.league_stats_utils import extract_stats_for_averaging, calculate_league_averages
 from ...utils.configuration_utils import apply_configuration_to_data
-from ...utils.ranking_utils import calculate_team_rankings, calculate_all_rankings
+from ...utils.ranking_utils import calculate_team_rankings, calculate_all_rankings, clear_ranking_cache
+from ...utils.season_utils import apply_season_type_filter
 from .simple_cache import SimpleCache
 
 logger = logging.getLogger(__name__)
@@ -135,10 +136,11 @@ class LeagueStatsCache:
         
         if complete_data is not None:
             # Filter the complete data by season type if needed
-            if season_type and season_type != 'ALL':
-                return complete_data[complete_data['season_type'] == season_type].copy()
-            else:
-                return complete_data.copy()
+            filtered_data = apply_season_type_filter(complete_data, season_type)
+            if filtered_data is complete_data:
+                # Shallow copy keeps the cached frame isolated without duplicating its data
+                return complete_data.copy(deep=False)
+            return filtered_data
         
         # Fallback: try to get the specific season type cache (for backward compatibility)
         specific_cache_key = f"raw_data_{season_year}_{season_type}"
@@ -298,12 +300,15 @@ class LeagueStatsCache:
                 cleared_stats['memory'] = self._memory_cache.clear(pattern)
                 cleared_stats['rankings'] = self._rankings_cache.clear(pattern)
                 cleared_stats['raw_data'] = self._raw_data_cache.clear(pattern)
+                cleared_stats['disk'] = self._clear_disk_cache(season_year)
                 logger.info(f"Cleared cache for season {season_year}: {cleared_stats}")
             else:
                 # Clear all cached data
                 cleared_stats['memory'] = self._memory_cache.clear()
                 cleared_stats['rankings'] = self._rankings_cache.clear()
                 cleared_stats['raw_data'] = self._raw_data_cache.clear()
+                cleared_stats['disk'] = self._clear_disk_cache()
+                clear_ranking_cache()
                 logger.info(f"Cleared all cached league statistics: {cleared_stats}")
                 
             return cleared_stats
@@ -323,17 +328,25 @@ class LeagueStatsCache:
                     # Clear specific season
                     pattern = f"pbp_{season_year}"
                     count = self._nfl_data_repo._cache.clear(pattern)
+                    count += self._clear_disk_cache(season_year)
                     logger.info(f"Cleared {count} repository cache entries for season {season_year}")
                 else:
                     # Clear all
                     count = self._nfl_data_repo._cache.clear()
+                    count += self._clear_disk_cache()
                     logger.info(f"Cleared {count} repository cache entries")
                 return count
-            return 0
+            return self._clear_disk_cache(season_year)
         except Exception as e:
             logger.error(f"Failed to clear repository cache: {e}")
             return 0
     
+    def _clear_disk_cache(self, season_year: Optional[int] = None) -> int:
+        """Delete the repository's local download copies so the next load refetches."""
+        if self._nfl_data_repo and hasattr(self._nfl_data_repo, 'clear_disk_cache'):
+            return self._nfl_data_repo.clear_disk_cache(season_year)
+        return 0
+    
     def force_cleanup(self) -> Dict[str, int]:
         """Force cleanup of expired entries across all caches.
         
@@ -416,10 +429,9 @@ class LeagueStatsCache:
                 
             filter_start = time.time()
             # Memory optimization: Use views instead of copies where possible
-            if season_type and season_type != 'ALL':
-                filtered_data = pbp_data[pbp_data['season_type'] == season_type].copy()
-            else:
-                filtered_data = pbp_data.copy()
+            filtered_data = apply_season_type_filter(pbp_data, season_type)
+            if filtered_data is pbp_data:
+                filtered_data = pbp_data.copy(deep=False)
             
             # Apply configuration filtering to the data before calculating statistics
             if configuration:
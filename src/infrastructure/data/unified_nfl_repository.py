@@ -1,6 +1,8 @@
 # src/infrastructure/data/unified_nfl_repository.py - NFL data repository
 
 import logging
+import time
+from pathlib import Path
 from typing import Optional, Tuple, Dict
 import pandas as pd
 import nfl_data_py as nfl
@@ -160,7 +162,24 @@ class UnifiedNFLRepository:
         'receiving_yards', 'passing_yards', 'rushing_yards'
     ]
     
-    def __init__(self):
+    # Column groups for dtype optimization after loading
+    BOOLEAN_COLUMNS = (
+        'rush_attempt', 'pass_attempt', 'complete_pass', 'sack',
+        'two_point_attempt', 'touchdown', 'interception', 'fumble_lost',
+        'first_down', 'first_down_rush', 'first_down_pass', 'first_down_penalty', 'success'
+    )
+    TEAM_COLUMNS = ('home_team', 'away_team', 'posteam', 'defteam', 'td_team', 'penalty_team')
+    RESULT_COLUMNS = ('field_goal_result', 'extra_point_result', 'two_point_conv_result')
+    SMALL_FLOAT_COLUMNS = ('down', 'yardline_100', 'drive')
+    
+    # Local copy of downloaded play-by-play data, reused across restarts for an hour
+    DISK_CACHE_DIR = Path.home() / '.cache' / 'nflstats'
+    DISK_CACHE_TTL = 3600
+    
+    def __init__(self, use_disk_cache: bool = True):
+        # Whether downloads are saved to and reused from DISK_CACHE_DIR
+        self._use_disk_cache = use_disk_cache
+        
         # Cache for NFL data with TTL and size limits
         self._cache = SimpleCache(
             default_ttl=1800,   # 30 minutes default TTL
@@ -194,6 +213,11 @@ class UnifiedNFLRepository:
                 def download_data():
                     nonlocal nfl_data, download_error
                     try:
+                        # A recent local copy skips the nflverse download entirely
+                        if self._use_disk_cache:
+                            nfl_data = self._read_disk_cache(season)
+                            if nfl_data is not None:
+                                return
                         # Use essential columns for faster loading
                         # Fall back to full column set if essential columns fail
                         try:
@@ -201,6 +225,8 @@ class UnifiedNFLRepository:
                         except Exception as e:
                             logger.warning(f"Failed with essential columns, using full set: {e}")
                             nfl_data = nfl.import_pbp_data([season], columns=self.NEEDED_COLUMNS)
+                        if self._use_disk_cache:
+                            self._write_disk_cache(season, nfl_data)
                     except Exception as e:
                         download_error = e
                     finally:
@@ -213,27 +239,23 @@ class UnifiedNFLRepository:
                         return df
                     
                     # Convert boolean-like float columns to actual booleans
-                    boolean_cols = ['rush_attempt', 'pass_attempt', 'complete_pass', 'sack', 
-                                   'two_point_attempt', 'touchdown', 'interception', 'fumble_lost',
-                                   'first_down', 'first_down_rush', 'first_down_pass', 'first_down_penalty', 'success']
-                    
-                    for col in boolean_cols:
+                    for col in self.BOOLEAN_COLUMNS:
                         if col in df.columns:
                             df[col] = df[col].fillna(0).astype(bool)
                     
                     # Convert team columns to categories (huge memory savings for repeated values)
-                    team_cols = ['home_team', 'away_team', 'posteam', 'defteam', 'td_team', 'penalty_team']
-                    for col in team_cols:
+                    for col in self.TEAM_COLUMNS:
                         if col in df.columns:
                             df[col] = df[col].astype('category')
                     
-                    # Convert play_type to category
+                    # Convert play_type and season_type to category
                     if 'play_type' in df.columns:
                         df['play_type'] = df['play_type'].astype('category')
+                    if 'season_type' in df.columns:
+                        df['season_type'] = df['season_type'].astype('category')
                     
                     # Convert result columns to categories (limited values)
-                    result_cols = ['field_goal_result', 'extra_point_result', 'two_point_conv_result']
-                    for col in result_cols:
+                    for col in self.RESULT_COLUMNS:
                         if col in df.columns:
                             df[col] = df[col].astype('category')
                     
@@ -241,6 +263,12 @@ class UnifiedNFLRepository:
                     if 'week' in df.columns:
                         df['week'] = df['week'].astype('int8')  # Weeks are 1-22
                     
+                    # Small whole-number columns that may be missing (NaN) and are only compared
+                    # or grouped on, never summed: float32 holds them exactly at half the size
+                    for col in self.SMALL_FLOAT_COLUMNS:
+                        if col in df.columns:
+                            df[col] = df[col].astype('float32')
+                    
                     return df
                 
                 # Start download
@@ -270,8 +298,11 @@ class UnifiedNFLRepository:
                 
                 # Get the latest game date from the actual data (represents when NFL data was last updated)
                 if 'game_date' in nfl_data.columns:
-                    # Find the most recent game date in the data
-                    latest_game_date = pd.to_datetime(nfl_data['game_date']).max()
+                    # Find the most recent game date in the data. nflverse dates are ISO
+                    # 'YYYY-MM-DD' strings, which sort chronologically, so only the
+                    # maximum needs parsing rather than every play's date
+                    # Missing dates are dropped first; max() cannot compare NaN with date strings
+                    latest_game_date = pd.to_datetime(nfl_data['game_date'].dropna().max())
                     timestamp = latest_game_date
                 else:
                     # Fallback to current time if game_date column is not available
@@ -310,6 +341,54 @@ class UnifiedNFLRepository:
             logger.error(f"Error loading NFL data for season {season}: {e}")
             raise DataAccessError(f"Failed to load {season} data: {str(e)}")
     
+    def _disk_cache_path(self, season: int) -> Path:
+        """Location of the local parquet copy of a season's downloaded play-by-play data."""
+        return self.DISK_CACHE_DIR / f"pbp_{season}.parquet"
+    
+    def _read_disk_cache(self, season: int) -> Optional[pd.DataFrame]:
+        """Load a season's play-by-play data from the local copy if it is recent enough."""
+        path = self._disk_cache_path(season)
+        try:
+            if not path.exists() or time.time() - path.stat().st_mtime > self.DISK_CACHE_TTL:
+                return None
+            data = pd.read_parquet(path)
+            logger.info(f"Loaded season {season} play-by-play data from local cache {path}")
+            return data
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable local cache for season {season}: {e}")
+            return None
+    
+    def _write_disk_cache(self, season: int, data: Optional[pd.DataFrame]) -> None:
+        """Save freshly downloaded play-by-play data locally; failures only cost the next download."""
+        if data is None or len(data) == 0:
+            return
+        path = self._disk_cache_path(season)
+        # Write then rename so a concurrent reader never sees a partial file
+        tmp_path = path.with_suffix('.parquet.tmp')
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            data.to_parquet(tmp_path, index=False)
+            tmp_path.replace(path)
+        except Exception as e:
+            logger.warning(f"Failed to write local cache for season {season}: {e}")
+            tmp_path.unlink(missing_ok=True)
+    
+    def clear_disk_cache(self, season: Optional[int] = None) -> int:
+        """Delete local play-by-play copies for one season, or all seasons.
+        
+        Returns:
+            Number of files removed
+        """
+        pattern = f"pbp_{season}.parquet*" if season else "pbp_*.parquet*"
+        removed = 0
+        for path in self.DISK_CACHE_DIR.glob(pattern):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError as e:
+                logger.warning(f"Failed to remove local cache file {path}: {e}")
+        return removed
+    
     def get_team_data(self, pbp_data: pd.DataFrame, team_abbreviation: str, 
                      configuration: Optional[Dict] = None) -> pd.DataFrame:
         """Filter play-by-play data for a specific team."""
@@ -321,7 +400,7 @@ class UnifiedNFLRepository:
             team_data = pbp_data[
                 (pbp_data['posteam'] == team_abbreviation) & 
                 (pbp_data['play_type'].isin(['pass', 'run']))
-            ].copy()
+            ]
             
             # Apply configuration if provided
             if configuration:
@@ -332,22 +411,6 @@ class UnifiedNFLRepository:
             logger.error(f"Error filtering team data for {team_abbreviation}: {e}")
             return pd.DataFrame()
     
-    def refresh_season_data(self, season: int, progress_callback=None, force: bool = False) -> bool:
-        """Refresh cached season data."""
-        try:
-            cache_key = f"pbp_{season}"
-            if force:
-                # Clear existing cache entry
-                self._cache.invalidate(cache_key)
-                logger.info(f"Forcefully cleared cache for season {season}")
-            
-            # Re-fetch data
-            data, _ = self.get_play_by_play_data(season, progress_callback)
-            return data is not None
-        except Exception as e:
-            logger.error(f"Error refreshing season {season} data: {e}")
-            return False
-
     def get_league_aggregates(self, season: int, season_type: Optional[str] = None) -> Optional[pd.DataFrame]:
         """This repository requires calculation - no aggregates available."""
         # season_type parameter not used - this repository doesn't support pre-aggregated data
@@ -10,12 +10,16 @@ from ..domain.nfl_stats_calculator import NFLStatsCalculator
 logger = logging.getLogger(__name__)
 
 
-def create_calculation_orchestrator():
-    """Create calculation orchestrator with all dependencies."""
+def create_calculation_orchestrator(cache_nfl_data: bool = True):
+    """Create calculation orchestrator with all dependencies.
+    
+    Args:
+        cache_nfl_data: Whether downloaded NFL data may be reused from the local disk copy
+    """
     from ..domain.orchestration import CalculationOrchestrator
     
     stats_calculator = NFLStatsCalculator()
-    data_repository = UnifiedNFLRepository()
+    data_repository = UnifiedNFLRepository(use_disk_cache=cache_nfl_data)
     
     # Use optimized SimpleCache - much faster than Streamlit cache for large DataFrames
     league_cache = LeagueStatsCache(
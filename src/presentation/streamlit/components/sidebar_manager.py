@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Dict
 from ....config import NFL_TEAMS, TEAM_DATA
 from ....utils.season_utils import get_current_nfl_season_info
-from ....utils.configuration_utils import get_configuration
+from ....utils.configuration_utils import get_configuration_mutable
 from ....domain.services import get_data_status
 
 
@@ -180,7 +180,7 @@ class SidebarManager:
         st.markdown("### Statistics Configuration")
         
         # Always use custom configuration
-        configuration = get_configuration('custom')
+        configuration = get_configuration_mutable('custom')
         
         # Play Exclusion Settings
         st.markdown("#### Play Exclusions")
@@ -23,6 +23,10 @@ class MultiStageProgressAdapter:
     
     def __init__(self, multi_stage_progress):
         self.progress = multi_stage_progress
+        # Resolve the underlying ProgressManager once; the adapter is created inside
+        # track_overall_progress, so it is already attached by the time we get here
+        self._pm = getattr(multi_stage_progress, 'pm', None)
+        self._total_weight = getattr(multi_stage_progress, 'total_weight', 100)
         self.current_stage = None
         self.stage_mapping = {
             "Fetching Data": "Fetching Data",
@@ -37,11 +41,10 @@ class MultiStageProgressAdapter:
         try:
             # The orchestrator calls with 0.0-1.0 range, convert to the progress manager's range
             # MultiStageProgress uses ProgressManager internally which expects step counts
-            if hasattr(self.progress, 'pm') and self.progress.pm:
+            if self._pm:
                 # Convert 0.0-1.0 to step count based on total_weight
-                total_weight = getattr(self.progress, 'total_weight', 100)
-                step_count = int(progress_value * total_weight)
-                self.progress.pm.update(step_count, message)
+                step_count = int(progress_value * self._total_weight)
+                self._pm.update(step_count, message)
                 
             # Log progress for debugging
             logger.debug(f"Progress: {progress_value:.1%} - {message}")
@@ -176,22 +179,23 @@ class StreamlitController:
     
     def _perform_analysis_with_progress(self, request: TeamAnalysisRequest):
         """Perform analysis with progress tracking."""
+        from ...infrastructure.factories import create_calculation_orchestrator
+        
         # Get or create a persistent orchestrator instance
         orchestrator_key = "calculation_orchestrator"
+        cache_instances = st.session_state.league_cache_instances
         
         if request.cache_nfl_data:
             # Use persistent orchestrator instance when caching is enabled
-            if orchestrator_key not in st.session_state.league_cache_instances:
-                from ...infrastructure.factories import create_calculation_orchestrator
+            if orchestrator_key not in cache_instances:
                 orchestrator = create_calculation_orchestrator()
-                st.session_state.league_cache_instances[orchestrator_key] = orchestrator
+                cache_instances[orchestrator_key] = orchestrator
                 # Register for cleanup when session disconnects
                 register_orchestrator_for_cleanup(orchestrator)
-            orchestrator = st.session_state.league_cache_instances[orchestrator_key]
+            orchestrator = cache_instances[orchestrator_key]
         else:
             # Create a fresh orchestrator instance when caching is disabled (forces fresh data)
-            from ...infrastructure.factories import create_calculation_orchestrator
-            orchestrator = create_calculation_orchestrator()
+            orchestrator = create_calculation_orchestrator(cache_nfl_data=False)
         
         # Create controller with the persistent/fresh orchestrator
         try:
@@ -221,22 +225,11 @@ class StreamlitController:
     
     def _get_cache_config_hash(self, configuration: Dict) -> str:
         """Get configuration hash for cache key generation."""
-        import json
-        import hashlib
-        
-        # Create a deterministic string representation
-        # Sort keys and handle nested dicts consistently  
-        def normalize_config(obj):
-            if isinstance(obj, dict):
-                return {k: normalize_config(v) for k, v in sorted(obj.items())}
-            elif isinstance(obj, list):
-                return [normalize_config(item) for item in obj]
-            else:
-                return obj
+        from ...utils.config_hasher import get_config_digest
         
-        normalized = normalize_config(configuration)
-        config_string = json.dumps(normalized, sort_keys=True, separators=(',', ':'))
-        return hashlib.md5(config_string.encode()).hexdigest()[:8]  # Short hash for readability
+        # Session state keys must be strings, so only the first 4 digest bytes
+        # are hex-encoded rather than formatting the full hexdigest
+        return get_config_digest(configuration)[:4].hex()  # Short hash for readability
     
     def _render_analysis_results(self, analysis_response, selections) -> None:
         """Render the analysis results."""
@@ -250,16 +243,10 @@ class StreamlitController:
             season_stats=analysis_response.season_stats
         )
         
-        # Create container for season metrics that can be cleared
-        metrics_container = st.container()
-        with metrics_container:
-            # Render season metrics
+        # Render season metrics and tabs in a single container so the front-end
+        # reconciles one subtree per rerun instead of two
+        with st.container():
             self.metrics_renderer.render_season_metrics(analysis_response)
-        
-        # Create container for tabs that can be cleared  
-        tabs_container = st.container()
-        with tabs_container:
-            # Render main content tabs
             self.tab_manager.render_analysis_tabs(
                 analysis_response=analysis_response
             )
@@ -3,10 +3,16 @@
 import json
 import hashlib
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Mapping
 
 logger = logging.getLogger(__name__)
 
+# Reused encoder instead of building a fresh one per json.dumps call.
+# Configurations are small static dicts, so circular-reference tracking is unnecessary.
+_JSON_ENCODE = json.JSONEncoder(
+    sort_keys=True, separators=(',', ':'), ensure_ascii=False, check_circular=False
+).encode
+
 
 def get_config_hash(configuration: Dict[str, Any]) -> str:
     """
@@ -15,14 +21,24 @@ def get_config_hash(configuration: Dict[str, Any]) -> str:
     Uses recursive normalization to ensure consistent hashing
     regardless of key/value order.
     """
+    return get_config_digest(configuration).hex()
+
+
+def get_config_digest(configuration: Dict[str, Any]) -> bytes:
+    """
+    Generate a stable raw 16-byte digest for configuration dictionaries.
+    
+    Same normalization as get_config_hash, but skips the hex conversion for
+    callers that only need the value as a lookup key.
+    """
     try:
         normalized = _normalize_config(configuration)
-        config_string = json.dumps(normalized, sort_keys=True, separators=(',', ':'))
-        return hashlib.md5(config_string.encode()).hexdigest()
+        config_string = _JSON_ENCODE(normalized)
+        return hashlib.md5(config_string.encode()).digest()
     except Exception as e:
         logger.error(f"Failed to generate config hash: {e}")
         # Return a consistent fallback hash for error cases
-        return hashlib.md5(str(configuration).encode()).hexdigest()
+        return hashlib.md5(str(configuration).encode()).digest()
 
 
 def _normalize_config(obj: Any) -> Any:
@@ -33,7 +49,7 @@ def _normalize_config(obj: Any) -> Any:
     - Handles nested dictionaries and lists
     - Preserves data types
     """
-    if isinstance(obj, dict):
+    if isinstance(obj, Mapping):
         return {k: _normalize_config(v) for k, v in sorted(obj.items())}
     elif isinstance(obj, list):
         return [_normalize_config(item) for item in obj]
@@ -1,6 +1,8 @@
 # src/utils/configuration_utils.py - Configuration utility functions
 
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
+import numpy as np
 import pandas as pd
 import logging
 
@@ -35,11 +37,17 @@ CONFIGURATIONS = {
 }
 
 
-def get_configuration(config_name: str) -> Dict:
-    """Get configuration by name."""
-    if config_name not in CONFIGURATIONS:
-        raise ValueError(f"Unknown configuration: {config_name}")
-    return CONFIGURATIONS[config_name].copy()
+def get_configuration(config_name: str) -> Mapping:
+    """Get a read-only view of a configuration by name."""
+    try:
+        return CONFIGURATIONS[config_name]
+    except KeyError:
+        raise ValueError(f"Unknown configuration: {config_name}") from None
+
+
+def get_configuration_mutable(config_name: str) -> Dict:
+    """Get a mutable copy of a configuration by name."""
+    return dict(get_configuration(config_name))
 
 
 def get_available_configurations() -> List[str]:
@@ -47,6 +55,64 @@ def get_available_configurations() -> List[str]:
     return list(CONFIGURATIONS.keys())
 
 
+# Action per (include_qb_kneels_rushing, include_qb_kneels_success_rate):
+# drop kneels entirely, mark them with a context label, or leave them alone (None)
+_KNEEL_ACTIONS = {
+    (False, False): 'drop',
+    (False, True): 'exclude_rushing',
+    (True, False): 'exclude_success_rate',
+    (True, True): None
+}
+
+# Context label per (include_spikes_completion, include_spikes_success_rate)
+_SPIKE_ACTIONS = {
+    (False, False): 'exclude_both',
+    (False, True): 'exclude_completion',
+    (True, False): 'exclude_success_rate',
+    (True, True): None
+}
+
+# Log wording for each context label
+_CONTEXT_SCOPES = {
+    'exclude_rushing': 'rushing metrics only',
+    'exclude_completion': 'completion percentage only',
+    'exclude_success_rate': 'success rate only',
+    'exclude_both': 'both completion % and success rate'
+}
+
+# Context marker levels; stored as categoricals (int8 codes) instead of object strings
+_KNEEL_CONTEXT = pd.CategoricalDtype(['exclude_rushing', 'exclude_success_rate'])
+_SPIKE_CONTEXT = pd.CategoricalDtype(['exclude_both', 'exclude_completion', 'exclude_success_rate'])
+
+
+def _context_column(length: int, positions: np.ndarray, label: str,
+                    dtype: pd.CategoricalDtype) -> pd.Categorical:
+    """Build a context marker column: label at the given row positions, missing elsewhere."""
+    codes = np.full(length, -1, dtype=np.int8)
+    codes[positions] = dtype.categories.get_loc(label)
+    return pd.Categorical.from_codes(codes, dtype=dtype)
+
+
+def _play_type_masks(play_type: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """Build the QB kneel and QB spike masks from one categorical encoding of play_type.
+    
+    Encoding the column once and comparing integer codes replaces two full
+    object-dtype string comparisons.
+    """
+    if play_type.dtype.name != 'category':
+        play_type = play_type.astype('category')
+    categories = play_type.cat.categories
+    codes = play_type.cat.codes.to_numpy()
+    
+    def mask_for(value: str) -> np.ndarray:
+        # Missing categories must not fall back to -1, which is the code for NaN
+        if value not in categories:
+            return np.zeros(len(codes), dtype=bool)
+        return codes == categories.get_loc(value)
+    
+    return mask_for('qb_kneel'), mask_for('qb_spike')
+
+
 def apply_configuration_to_data(data: pd.DataFrame, config: Dict) -> pd.DataFrame:
     """Apply configuration filtering to NFL play-by-play data.
     
@@ -74,56 +140,77 @@ def apply_configuration_to_data(data: pd.DataFrame, config: Dict) -> pd.DataFram
         logger.warning("Configuration is None, using default settings")
         config = {}
     
-    filtered_data = data.copy()
+    kneel_action = _KNEEL_ACTIONS[(
+        bool(config.get('include_qb_kneels_rushing', True)),
+        bool(config.get('include_qb_kneels_success_rate', True))
+    )]
+    spike_action = _SPIKE_ACTIONS[(
+        bool(config.get('include_spikes_completion', True)),
+        bool(config.get('include_spikes_success_rate', True))
+    )]
+    
+    # Nothing to exclude or mark (e.g. NFL official settings) - hand back the data untouched
+    if (kneel_action is None and spike_action is None) or 'play_type' not in data.columns:
+        return data
+    
+    # The input frame is never modified: rows are filtered into a new frame and the
+    # context markers are set on a shallow copy, which shares every existing column
+    # with the input and only materializes the new ones
+    filtered_data = data
+    context_columns = {}
+    info_enabled = logger.isEnabledFor(logging.INFO)
+    
+    qb_kneel_mask, qb_spike_mask = _play_type_masks(data['play_type'])
     
     # Apply QB kneel filtering based on configuration
     # QB kneels are typically used to run out the clock and may skew rushing statistics
-    if 'play_type' in filtered_data.columns:
-        qb_kneel_mask = filtered_data['play_type'] == 'qb_kneel'
-        qb_kneels_exist = qb_kneel_mask.any()
-        
-        if qb_kneels_exist:
-            include_rushing = config.get('include_qb_kneels_rushing', True)
-            include_success_rate = config.get('include_qb_kneels_success_rate', True)
-            
-            # Apply filtering logic based on configuration matrix
-            if not include_rushing and not include_success_rate:
-                # Complete exclusion: remove QB kneels entirely
-                filtered_data = filtered_data[~qb_kneel_mask]
-                logger.info(f"Removed {qb_kneel_mask.sum()} QB kneel plays from analysis")
-            elif not include_rushing and include_success_rate:
-                # Partial exclusion: mark for context-aware filtering
-                # QB kneels excluded from rushing metrics but included in success rate
-                filtered_data.loc[qb_kneel_mask, '_qb_kneel_context'] = 'exclude_rushing'
-                logger.info(f"Marked {qb_kneel_mask.sum()} QB kneel plays to exclude from rushing metrics only")
-            elif include_rushing and not include_success_rate:
-                # Filter QB kneels from success rate but keep for rushing
-                filtered_data.loc[qb_kneel_mask, '_qb_kneel_context'] = 'exclude_success_rate'
-                logger.info(f"Marked {qb_kneel_mask.sum()} QB kneel plays to exclude from success rate only")
-            # If both are True, keep all QB kneels (no filtering needed)
+    # Row positions are found once and reused for the existence check, the count
+    # and the marker write, which is a plain integer-indexed NumPy store
+    kneel_positions = np.flatnonzero(qb_kneel_mask) if kneel_action is not None else None
+    if kneel_positions is not None and kneel_positions.size:
+        if kneel_action == 'drop':
+            # Complete exclusion: remove QB kneels entirely
+            filtered_data = data[~qb_kneel_mask]
+            qb_spike_mask = qb_spike_mask[~qb_kneel_mask]
+            if info_enabled:
+                logger.info("Removed %d QB kneel plays from analysis", kneel_positions.size)
+        else:
+            # Partial exclusion: mark for context-aware filtering
+            context_columns['_qb_kneel_context'] = _context_column(
+                len(data), kneel_positions, kneel_action, _KNEEL_CONTEXT
+            )
+            if info_enabled:
+                logger.info("Marked %d QB kneel plays to exclude from %s",
+                            kneel_positions.size, _CONTEXT_SCOPES[kneel_action])
     
     # Apply QB spike filtering based on configuration
-    if 'play_type' in filtered_data.columns:
-        qb_spike_mask = filtered_data['play_type'] == 'qb_spike'
-        qb_spikes_exist = qb_spike_mask.any()
-        
-        if qb_spikes_exist:
-            include_spikes_completion = config.get('include_spikes_completion', True)
-            include_spikes_success_rate = config.get('include_spikes_success_rate', True)
-            
-            # Apply filtering logic for spikes
-            if not include_spikes_completion and not include_spikes_success_rate:
-                # Exclude from both completion % and success rate
-                filtered_data.loc[qb_spike_mask, '_spike_context'] = 'exclude_both'
-                logger.info(f"Marked {qb_spike_mask.sum()} QB spike plays to exclude from both completion % and success rate")
-            elif not include_spikes_completion and include_spikes_success_rate:
-                # Exclude from completion % only
-                filtered_data.loc[qb_spike_mask, '_spike_context'] = 'exclude_completion'
-                logger.info(f"Marked {qb_spike_mask.sum()} QB spike plays to exclude from completion percentage only")
-            elif include_spikes_completion and not include_spikes_success_rate:
-                # Exclude from success rate only
-                filtered_data.loc[qb_spike_mask, '_spike_context'] = 'exclude_success_rate'
-                logger.info(f"Marked {qb_spike_mask.sum()} QB spike plays to exclude from success rate only")
-            # If both are True, keep all QB spikes (no filtering needed)
+    spike_positions = np.flatnonzero(qb_spike_mask) if spike_action is not None else None
+    if spike_positions is not None and spike_positions.size:
+        context_columns['_spike_context'] = _context_column(
+            len(filtered_data), spike_positions, spike_action, _SPIKE_CONTEXT
+        )
+        if info_enabled:
+            logger.info("Marked %d QB spike plays to exclude from %s",
+                        spike_positions.size, _CONTEXT_SCOPES[spike_action])
+    
+    if context_columns:
+        # Unlike assign, which deep-copies the frame before pandas 3.0, copy(deep=False)
+        # shares columns on every pandas version. Markers are positional arrays, so
+        # they line up with filtered_data's rows
+        filtered_data = filtered_data.copy(deep=False)
+        for column, markers in context_columns.items():
+            filtered_data[column] = markers
     
-    return filtered_data
\ No newline at end of file
+    return filtered_data
+
+
+def _freeze_configuration(config: Dict) -> Mapping:
+    """Make a static configuration read-only."""
+    return MappingProxyType(dict(config))
+
+
+# Built once at import so get_configuration can hand entries out without copying
+CONFIGURATIONS = {
+    name: _freeze_configuration(config)
+    for name, config in CONFIGURATIONS.items()
+}
\ No newline at end of file
@@ -23,6 +23,13 @@ def handle_service_errors(
         default_return: Default value to return on error (if not raising)
         log_level: Logging level ('error', 'warning', 'info')
     """
+    # Resolve the logging method once instead of dispatching on log_level per error
+    log_fn = {
+        "error": logger.error,
+        "warning": logger.warning,
+        "info": logger.info
+    }.get(log_level, logger.error)
+    
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
@@ -30,20 +37,16 @@ def handle_service_errors(
                 return func(*args, **kwargs)
             except Exception as e:
                 error_msg = f"Failed to {operation}: {str(e)}"
-                
-                # Log at specified level
-                if log_level == "error":
-                    logger.error(error_msg)
-                elif log_level == "warning":
-                    logger.warning(error_msg)
-                elif log_level == "info":
-                    logger.info(error_msg)
+                log_fn(error_msg)
                 
                 # Raise appropriate error type or return default
                 if default_return is not None:
                     return default_return
+                elif isinstance(e, error_type):
+                    # Already the right type (e.g. from a nested handler) - no need to rewrap
+                    raise
                 else:
-                    raise error_type(error_msg, operation, getattr(e, '__dict__', {}))
+                    raise error_type(error_msg, operation, {'error_type': type(e).__name__}) from e
         
         return wrapper
     return decorator
@@ -103,6 +106,7 @@ class ErrorContext:
         self.default_return = default_return
         self.suppress_errors = suppress_errors
         self.exception = None
+        self._log_error = logger.error
     
     def __enter__(self):
         return self
@@ -110,16 +114,17 @@ class ErrorContext:
     def __exit__(self, exc_type, exc_val, exc_tb):
         if exc_type is not None:
             self.exception = exc_val
-            error_msg = f"Failed to {self.operation}: {str(exc_val)}"
-            logger.error(error_msg)
+            self._log_error("Failed to %s: %s", self.operation, exc_val)
             
             if self.suppress_errors:
                 return True  # Suppress the exception
             elif self.default_return is not None:
                 return True  # Suppress and return default
+            elif isinstance(exc_val, self.error_type):
+                return False  # Already the right type - let it propagate unwrapped
             else:
                 # Re-raise as specified error type
-                if exc_type != self.error_type:
-                    raise self.error_type(error_msg, self.operation, {}) from exc_val
+                error_msg = f"Failed to {self.operation}: {str(exc_val)}"
+                raise self.error_type(error_msg, self.operation, {}) from exc_val
         
         return False
\ No newline at end of file
@@ -1,38 +1,59 @@
 # src/utils/ranking_utils.py - Team ranking utility functions
 
-from typing import Dict, List, Tuple
+from bisect import bisect_left
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, Tuple
 import logging
+import numpy as np
+from ..config.nfl_constants import TOTAL_NFL_TEAMS
 from ..domain.entities import PerformanceRank
 from .nfl_metrics import LOWER_IS_BETTER_METRICS, RANKING_METRICS
 
 logger = logging.getLogger(__name__)
 
 
+# Multiplier that makes lower always rank better, in RANKING_METRICS order
+_METRIC_SIGN = np.array([1.0 if metric in LOWER_IS_BETTER_METRICS else -1.0 for metric in RANKING_METRICS])
+
+# Worst rank in each performance tier, and each tier's (description, color);
+# ranks past the last limit fall into the final "Poor" tier
+_TIER_RANK_LIMITS = (1, 3, 8, 16, 24)
+_TIERS = (
+    ("Best in NFL", "gold"),
+    ("Elite", "green"),
+    ("Excellent", "lightgreen"),
+    ("Above Average", "yellow"),
+    ("Below Average", "orange"),
+    ("Poor", "red"),
+)
+
+_TOP_FMT = "Top {}%".format
+_BOTTOM_FMT = "Bottom {}%".format
+
+# Reads every ranking metric of one stats object in a single call
+_ALL_METRICS_GETTER = attrgetter(*RANKING_METRICS)
+
+
 def calculate_all_rankings(team_stats_dict: Dict) -> Dict[str, Dict]:
     """Calculate rankings for ALL teams at once from league statistics dictionary.
     
+    All metrics are ranked together: team values are stacked into one
+    (teams, metrics) matrix and sorted column-wise in a single pass.
+    Teams missing a metric are left unranked for it. Results are memoized
+    on the league's metric values, so repeated calls reuse the same table.
+    
     Args:
         team_stats_dict: Dictionary mapping team abbreviations to their SeasonStats objects
         
     Returns:
         Dictionary mapping team abbreviations to their rankings dict
     """
-    all_rankings = {}
-    
-    # Pre-calculate rankings for all metrics once
-    metric_rankings = {}
-    for metric in RANKING_METRICS:
-        metric_rankings[metric] = _calculate_all_ranks_for_metric(team_stats_dict, metric)
-    
-    # Assign rankings to each team
-    for team_abbr in team_stats_dict:
-        team_rankings = {}
-        for metric in RANKING_METRICS:
-            if team_abbr in metric_rankings[metric]:
-                team_rankings[metric] = metric_rankings[metric][team_abbr]
-        all_rankings[team_abbr] = team_rankings
+    if not team_stats_dict:
+        return {}
     
-    return all_rankings
+    all_rankings = _cached_all_rankings(_stats_fingerprint(team_stats_dict))
+    return {team_abbr: dict(team_rankings) for team_abbr, team_rankings in all_rankings.items()}
 
 
 def calculate_team_rankings(team_abbr: str, team_stats_dict: Dict) -> Dict:
@@ -44,6 +65,9 @@ def calculate_team_rankings(team_abbr: str, team_stats_dict: Dict) -> Dict:
       lower values rank better for turnovers, sacks allowed, penalties
     - Provides 1-based ranking (1st = best, 32nd = worst in 32-team league)
     
+    The whole league table is ranked once and shared with calculate_all_rankings,
+    so asking for many teams does not re-sort per team and metric.
+    
     Args:
         team_abbr: Team abbreviation to calculate rankings for (e.g., 'KC', 'BUF')
         team_stats_dict: Dictionary mapping team abbreviations to SeasonStats objects
@@ -57,138 +81,112 @@ def calculate_team_rankings(team_abbr: str, team_stats_dict: Dict) -> Dict:
         # Returns: {'avg_yards_per_play': 3, 'turnovers_per_game': 8, ...}
     """
     if team_abbr not in team_stats_dict:
-        logger.warning(f"Team '{team_abbr}' not found in team stats dictionary")
+        logger.warning("Team '%s' not found in team stats dictionary", team_abbr)
         return {}
     
-    rankings = {}
-    team_stats = team_stats_dict[team_abbr]
-    
-    for metric in RANKING_METRICS:
-        if hasattr(team_stats, metric):
-            team_value = getattr(team_stats, metric)
-            
-            # Get all team values for this metric
-            team_values = _extract_metric_values(team_stats_dict, metric)
-            
-            # Calculate rank for this team
-            rank = _calculate_metric_rank(team_abbr, team_value, team_values, metric)
-            if rank:
-                rankings[metric] = rank
-    
-    return rankings
+    all_rankings = _cached_all_rankings(_stats_fingerprint(team_stats_dict))
+    return dict(all_rankings[team_abbr])
+
 
+def _stats_fingerprint(team_stats_dict: Dict) -> Tuple:
+    """Hashable snapshot of every team's ranking metric values (None when missing)."""
+    return tuple(
+        (team_abbr, _metric_row(stats))
+        for team_abbr, stats in team_stats_dict.items()
+    )
 
-def _calculate_all_ranks_for_metric(team_stats_dict: Dict, metric: str) -> Dict[str, int]:
-    """Calculate ranks for all teams for a single metric."""
-    # Get all team values for this metric
-    team_values = _extract_metric_values(team_stats_dict, metric)
+
+def _metric_row(stats) -> Tuple:
+    """All ranking metric values of one stats object, in RANKING_METRICS order."""
+    try:
+        return _ALL_METRICS_GETTER(stats)
+    except AttributeError:
+        # Partial stats objects: fall back to per-metric reads with None for gaps
+        return tuple(getattr(stats, metric, None) for metric in RANKING_METRICS)
+
+
+@lru_cache(maxsize=8)
+def _cached_all_rankings(fingerprint: Tuple) -> Dict[str, Dict[str, int]]:
+    """Rank every team on every metric for a league snapshot.
     
-    # Sort by value based on whether lower or higher is better
-    if metric in LOWER_IS_BETTER_METRICS:
-        ranked_teams = sorted(team_values, key=lambda x: x[1])
-    else:
-        ranked_teams = sorted(team_values, key=lambda x: x[1], reverse=True)
-    
-    # Assign ranks with tie handling
-    ranks = {}
-    current_rank = 1
-    for i, (abbr, value) in enumerate(ranked_teams):
-        if i > 0:
-            prev_value = ranked_teams[i-1][1]
-            if value != prev_value:
-                current_rank = i + 1
-        ranks[abbr] = current_rank
+    The returned table is shared between callers and must not be mutated.
+    """
+    # One (teams, metrics) matrix; missing values (None) become NaN
+    values = np.array([row for _, row in fingerprint], dtype=np.float64).reshape(
+        len(fingerprint), len(RANKING_METRICS)
+    )
+    ranks = _min_ranks(values * _METRIC_SIGN)
+    present = ~np.isnan(values)
     
-    return ranks
-
+    # Assign rankings to each team
+    all_rankings = {}
+    for (team_abbr, _), rank_row, present_row in zip(fingerprint, ranks.tolist(), present.tolist()):
+        all_rankings[team_abbr] = {
+            metric: rank
+            for metric, rank, is_present in zip(RANKING_METRICS, rank_row, present_row)
+            if is_present
+        }
+    
+    return all_rankings
 
-def _extract_metric_values(team_stats_dict: Dict, metric: str) -> List[Tuple[str, float]]:
-    """Extract all team values for a specific metric."""
-    team_values = []
-    for abbr, stats in team_stats_dict.items():
-        if hasattr(stats, metric):
-            value = getattr(stats, metric)
-            team_values.append((abbr, value))
 
-    return team_values
+def clear_ranking_cache() -> None:
+    """Drop memoized rankings, e.g. after league statistics have been reloaded."""
+    _cached_all_rankings.cache_clear()
 
 
-def _calculate_metric_rank(team_abbr: str, team_value: float, 
-                          team_values: List[Tuple[str, float]], metric: str) -> int:
-    """Calculate the rank for a team's metric value with proper tie handling.
+def _min_ranks(key: np.ndarray) -> np.ndarray:
+    """Rank along the first axis with the 'min' tie method, lower key ranking better.
     
-    Implements the 'min' ranking method used in sports statistics:
-    - Teams with identical values receive the same rank (the best available rank)
-    - Subsequent ranks are adjusted to account for tied positions
-    - Example: If 3 teams tie for 2nd place, they all get rank 2, next team gets rank 5
+    Tied values share the best rank. Works on a 1-D array or column-wise on a
+    (teams, metrics) matrix: one stable NumPy sort plus a running maximum replaces
+    the Python sort and tie-tracking loop.
+    """
+    n = key.shape[0]
+    order = np.argsort(key, axis=0, kind='stable')
+    sorted_key = np.take_along_axis(key, order, axis=0)
+    
+    # A position starts a new rank wherever its value differs from the previous one;
+    # tied positions carry the rank of the first position in their run forward
+    is_new = np.empty(key.shape, dtype=bool)
+    is_new[:1] = True
+    np.not_equal(sorted_key[1:], sorted_key[:-1], out=is_new[1:])
+    positions = np.arange(1, n + 1).reshape((n,) + (1,) * (key.ndim - 1))
+    ranks_sorted = np.maximum.accumulate(np.where(is_new, positions, 0), axis=0)
+    
+    ranks = np.empty(key.shape, dtype=np.int64)
+    np.put_along_axis(ranks, order, ranks_sorted, axis=0)
+    return ranks
+
+
+def calculate_performance_rank(rank: int, total_teams: int = TOTAL_NFL_TEAMS) -> PerformanceRank:
+    """Convert a raw rank to a PerformanceRank object with context.
     
-    Args:
-        team_abbr: Team abbreviation to find rank for
-        team_value: The team's value for this metric
-        team_values: List of (team_abbr, value) tuples for all teams
-        metric: Metric name (determines sort direction via LOWER_IS_BETTER_METRICS)
-        
-    Returns:
-        Integer rank position (1-based), or None if team not found
+    Ranks in a full league come from a table built at import and smaller
+    leagues (e.g. partial seasons) are memoized per (rank, total_teams), so the
+    percentile strings are formatted once; the returned object is frozen, so
+    it can be shared safely.
     """
-    try:
-        # Sort by value based on whether lower or higher is better
-        if metric in LOWER_IS_BETTER_METRICS:
-            # Lower is better for turnovers, sacks allowed, penalty yards
-            ranked_teams = sorted(team_values, key=lambda x: x[1])
-        else:
-            # Higher is better for most offensive metrics (yards/play, completion %, etc.)
-            ranked_teams = sorted(team_values, key=lambda x: x[1], reverse=True)
-        
-        # Handle ties using 'min' method - all tied values get the same (minimum) rank
-        current_rank = 1
-        for i, (abbr, value) in enumerate(ranked_teams):
-            if i > 0:
-                prev_value = ranked_teams[i-1][1]
-                # If value changed from previous, update rank to position + 1
-                if value != prev_value:
-                    current_rank = i + 1
-            
-            if abbr == team_abbr:
-                return current_rank
-        
-        return None
-        
-    except Exception as e:
-        logger.error(f"Error calculating rank for {team_abbr} {metric}: {e}")
-        return None
+    if total_teams == TOTAL_NFL_TEAMS and 1 <= rank <= TOTAL_NFL_TEAMS:
+        return _PERF_RANK_TABLE[rank - 1]
+    return _compute_performance_rank(rank, total_teams)
 
 
-def calculate_performance_rank(rank: int, total_teams: int) -> PerformanceRank:
-    """Convert a raw rank to a PerformanceRank object with context."""
-    # Calculate percentile (higher percentile = better performance)
-    percentile = ((total_teams - rank + 1) / total_teams) * 100
+@lru_cache(maxsize=1024)
+def _compute_performance_rank(rank: int, total_teams: int) -> PerformanceRank:
+    """Build a PerformanceRank for any league size."""
+    # Whole-number percentiles (higher = better performance) via integer division
+    teams_at_or_below = total_teams - rank + 1
     
     # Determine description and color based on rank
-    if rank == 1:
-        description = "Best in NFL"
-        color = "gold"
+    tier = bisect_left(_TIER_RANK_LIMITS, rank)
+    description, color = _TIERS[tier]
+    if tier == 0:
         percentile_str = "1st"
-    elif rank <= 3:
-        description = "Elite"
-        color = "green"
-        percentile_str = f"Top {int(percentile)}%"
-    elif rank <= 8:
-        description = "Excellent"
-        color = "lightgreen"
-        percentile_str = f"Top {int(percentile)}%"
-    elif rank <= 16:
-        description = "Above Average"
-        color = "yellow"
-        percentile_str = f"Top {int(percentile)}%"
-    elif rank <= 24:
-        description = "Below Average"
-        color = "orange"
-        percentile_str = f"Bottom {int(100 - percentile)}%"
+    elif tier <= 3:
+        percentile_str = _TOP_FMT(teams_at_or_below * 100 // total_teams)
     else:
-        description = "Poor"
-        color = "red"
-        percentile_str = f"Bottom {int(100 - percentile)}%"
+        percentile_str = _BOTTOM_FMT((rank - 1) * 100 // total_teams)
     
     return PerformanceRank(
         rank=rank,
@@ -196,4 +194,10 @@ def calculate_performance_rank(rank: int, total_teams: int) -> PerformanceRank:
         description=description,
         percentile=percentile_str,
         color=color
-    )
\ No newline at end of file
+    )
+
+
+# Every possible PerformanceRank in a full league, indexed by rank - 1
+_PERF_RANK_TABLE = tuple(
+    _compute_performance_rank(rank, TOTAL_NFL_TEAMS) for rank in range(1, TOTAL_NFL_TEAMS + 1)
+)
\ No newline at end of file
@@ -1,19 +1,39 @@
 # src/utils/season_utils.py - Season-related utility functions
 
+import heapq
 import logging
-from typing import Dict, Optional
-from datetime import datetime
+from functools import lru_cache
+from typing import Dict, FrozenSet, Optional, Tuple
+from datetime import date, datetime
+import numpy as np
+import pandas as pd
 from ..config.nfl_constants import NFL_SEASON_START_MONTH, NFL_DATA_START_YEAR, NFL_REGULAR_SEASON_GAMES
 from ..domain.entities import Season
 
 logger = logging.getLogger(__name__)
 
+# Season types kept by each season type filter
+_SEASON_TYPE_FILTERS = {
+    'ALL': frozenset(('REG', 'POST')),
+    'REG': frozenset(('REG',)),
+    'POST': frozenset(('POST',)),
+}
+
 
 def get_current_nfl_season_info() -> Dict:
-    """Get comprehensive current NFL season information."""
-    now = datetime.now()
-    current_month = now.month
-    current_year = now.year
+    """Get comprehensive current NFL season information.
+    
+    The information only changes with the calendar date, so it is computed once
+    per day and each caller gets its own copy of the cached dict.
+    """
+    return dict(_season_info_for(datetime.now().date()))
+
+
+@lru_cache(maxsize=1)
+def _season_info_for(today: date) -> Dict:
+    """Build the season information for a given calendar date."""
+    current_month = today.month
+    current_year = today.year
     
     if current_month >= NFL_SEASON_START_MONTH:  # September or later
         current_season = current_year
@@ -40,10 +60,16 @@ def get_current_nfl_season_info() -> Dict:
         'season_status': season_status,
         'expected_games': expected_games,
         'data_complete': data_complete,
-        'available_seasons': list(range(current_season, NFL_DATA_START_YEAR - 1, -1))
+        'available_seasons': _available_seasons(current_season)
     }
 
 
+@lru_cache(maxsize=4)
+def _available_seasons(current_season: int) -> Tuple[int, ...]:
+    """Seasons with data, newest first; shared immutable tuple per current season."""
+    return tuple(range(current_season, NFL_DATA_START_YEAR - 1, -1))
+
+
 def get_season_context_message(season: Season, actual_games: Optional[int] = None) -> Dict[str, str]:
     """Get contextual message about the selected season."""
     season_info = get_current_nfl_season_info()
@@ -67,6 +93,7 @@ def get_season_context_message(season: Season, actual_games: Optional[int] = Non
         return {'message': f"{season.year} season: Historical data", 'type': 'success'}
 
 
+@lru_cache(maxsize=64)
 def get_regular_season_weeks(season_year: int) -> int:
     """Get the number of regular season weeks for a given NFL season.
     
@@ -86,6 +113,7 @@ def get_regular_season_weeks(season_year: int) -> int:
         return 16
 
 
+@lru_cache(maxsize=64)
 def get_regular_season_games(season_year: int) -> int:
     """Get the number of regular season games for a given NFL season.
     
@@ -128,33 +156,48 @@ def apply_season_type_filter(data, season_type_filter: str):
     Returns:
         Filtered DataFrame based on season type
     """
-    if season_type_filter == "ALL":
-        # Return both regular season and playoffs
-        filtered_data = data[data['season_type'].isin(['REG', 'POST'])]
-    elif season_type_filter == "REG":
-        # Return only regular season
-        filtered_data = data[data['season_type'] == 'REG']
-    elif season_type_filter == "POST":
-        # Return only playoffs
-        filtered_data = data[data['season_type'] == 'POST']
-        
-        # Handle case where team didn't make playoffs
-        if len(filtered_data) == 0 and len(data) > 0:
-            # Extract team identifiers from multiple possible columns to provide context
-            # Different datasets may use different column names for team identification
-            teams_in_data = set()
-            if 'posteam' in data.columns:
-                teams_in_data.update(data['posteam'].dropna().unique())
-            if 'home_team' in data.columns:
-                teams_in_data.update(data['home_team'].dropna().unique())
-            if 'away_team' in data.columns:
-                teams_in_data.update(data['away_team'].dropna().unique())
-                
-            if teams_in_data:
-                team_str = ', '.join(sorted(teams_in_data)[:3])  # Show first few teams
-                logger.info(f"No playoff data found for team(s): {team_str} - team likely did not make playoffs")
-    else:
+    wanted = _SEASON_TYPE_FILTERS.get(season_type_filter)
+    if wanted is None or 'season_type' not in data.columns:
         # Default to all games
-        filtered_data = data
+        return data
+    
+    mask = _season_type_mask(data['season_type'], wanted)
+    if mask.all():
+        # Already homogeneous (e.g. filtered upstream) - nothing to drop
+        return data
+    filtered_data = data[mask]
+    
+    # Handle case where team didn't make playoffs
+    # The team listing below only feeds an INFO message, so skip it when that is off
+    if season_type_filter == "POST" and len(filtered_data) == 0 and logger.isEnabledFor(logging.INFO):
+        # Extract team identifiers from multiple possible columns to provide context
+        # Different datasets may use different column names for team identification
+        # The present columns are stacked and de-duplicated in one vectorized pass
+        team_cols = [col for col in ('posteam', 'home_team', 'away_team') if col in data.columns]
+        teams_in_data = []
+        if team_cols:
+            stacked = pd.concat([data[col] for col in team_cols], ignore_index=True).dropna()
+            teams_in_data = pd.unique(stacked).tolist()
+            
+        if teams_in_data:
+            team_str = ', '.join(heapq.nsmallest(3, teams_in_data))  # Show first few teams
+            logger.info(f"No playoff data found for team(s): {team_str} - team likely did not make playoffs")
         
-    return filtered_data
\ No newline at end of file
+    return filtered_data
+
+
+def _season_type_mask(season_type: pd.Series, wanted: FrozenSet[str]) -> np.ndarray:
+    """Boolean mask of rows whose season type is one of the wanted values.
+    
+    Categorical columns (as loaded by the NFL data repository) are matched on
+    their integer codes, so only the few category labels are compared as strings.
+    """
+    if isinstance(season_type.dtype, pd.CategoricalDtype):
+        categories = season_type.cat.categories
+        codes = season_type.cat.codes.to_numpy()
+        if wanted.issuperset(categories):
+            # Every category is wanted (e.g. ALL on REG/POST data): only missing values drop out
+            return codes >= 0
+        wanted_codes = [code for code, value in enumerate(categories) if value in wanted]
+        return np.isin(codes, wanted_codes)
+    return season_type.isin(wanted).to_numpy()
@@ -10,6 +10,16 @@ This module provides the correct display names based on the year.
 """
 
 
+from ..config.nfl_constants import TEAM_DATA
+
+# Historical names for relocated/renamed teams: code -> (first year, last year, name)
+_HISTORICAL_NAMES = {
+    'LA': (1995, 2015, 'St. Louis Rams'),         # LA Rams -> St. Louis Rams (1995-2015)
+    'LV': (1995, 2019, 'Oakland Raiders'),        # LV Raiders -> Oakland Raiders (1995-2019)
+    'LAC': (0, 2016, 'San Diego Chargers'),       # LAC Chargers -> San Diego Chargers (1960-2016)
+}
+
+
 def get_team_display_name(team_code: str, year: int = None) -> str:
     """
     Get the display name for a team, accounting for historical names.
@@ -22,22 +32,13 @@ def get_team_display_name(team_code: str, year: int = None) -> str:
         The team's display name appropriate for that year
     """
     # Check if this team had a different name in the given year
-    if year:
-        # LA Rams -> St. Louis Rams (1995-2015)
-        if team_code == 'LA' and 1995 <= year <= 2015:
-            return 'St. Louis Rams'
-        
-        # LV Raiders -> Oakland Raiders (1995-2019)
-        if team_code == 'LV' and 1995 <= year <= 2019:
-            return 'Oakland Raiders'
-        
-        # LAC Chargers -> San Diego Chargers (1960-2016)
-        if team_code == 'LAC' and year <= 2016:
-            return 'San Diego Chargers'
+    if year and team_code in _HISTORICAL_NAMES:
+        first_year, last_year, historical_name = _HISTORICAL_NAMES[team_code]
+        if first_year <= year <= last_year:
+            return historical_name
     
     # Otherwise use the current team data
-    from ..config.nfl_constants import TEAM_DATA
     if team_code in TEAM_DATA:
         return TEAM_DATA[team_code]['name']
     
-    return f"Unknown Team ({team_code})"
\ No newline at end of file
+    return f"Unknown Team ({team_code})"
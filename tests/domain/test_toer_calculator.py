@@ -5,421 +5,431 @@ Comprehensive unit tests for TOERCalculator.
 Tests all scoring methods, edge cases, validation, and the main calculate_toer method.
 """
 
+import numpy as np
 import pytest
+from src.domain._toer_kernels import display_indices, toer_columns
 from src.domain.toer_calculator import TOERCalculator, TOERValidationError
 
 
+@pytest.fixture(scope="session")
+def calc():
+    """TOER calculator under test, resolved once per session."""
+    return TOERCalculator
+
+
+_YPP_BOUNDARIES = [
+    (5.51, 10),  # > 5.5
+    (5.50, 9),   # 5.5
+    (5.49, 8),   # 5.45-5.49
+    (5.45, 8),
+    (5.44, 7),   # 5.40-5.44
+    (5.40, 7),
+    (5.39, 6),   # 5.35-5.39
+    (5.35, 6),
+    (5.34, 5),   # 5.30-5.34
+    (5.30, 5),
+    (5.29, 4),   # 5.25-5.29
+    (5.25, 4),
+    (5.24, 3),   # 5.20-5.24
+    (5.20, 3),
+    (5.19, 2),   # 5.15-5.19
+    (5.15, 2),
+    (5.14, 1),   # 5.10-5.14
+    (5.10, 1),
+    (5.09, 0),   # < 5.10
+]
+
+# Realistic YPP values from actual games (yards / plays)
+_REAL_WORLD_YPP = [
+    (121 / 22, 9),    # 5.5 exactly (121 yards on 22 plays) - scores 9
+    (385 / 70, 9),    # 5.5 exactly (385 yards on 70 plays) - scores 9
+    (484 / 88, 9),    # 5.5 exactly (484 yards on 88 plays) - scores 9
+    (606 / 110, 10),  # 5.509090909090909 - The Arizona Cardinals case! - scores 10
+    (371 / 68, 8),    # 5.455882352941177
+    (299 / 55, 7),    # 5.436363636363636
+    (412 / 76, 7),    # 5.421052631578947
+    (287 / 53, 7),    # 5.415094339622641
+    (325 / 61, 5),    # 5.327868852459016
+    (380 / 72, 4),    # 5.277777777777778
+    (295 / 57, 2),    # 5.175438596491228
+    (301 / 59, 1),    # 5.101694915254237
+]
+
+_COMPLETION_PCT_RANGES = [
+    (67.25, 9),
+    (66.75, 8),
+    (66.25, 7),
+    (65.75, 6),
+    (65.25, 5),
+    (64.75, 4),
+    (64.25, 3),
+    (63.75, 2),
+    (63.25, 1),
+]
+
+_RUSH_YPC_RANGES = [
+    (4.67, 9),
+    (4.62, 8),
+    (4.57, 7),
+    (4.52, 6),
+    (4.47, 5),
+    (4.42, 4),
+    (4.37, 3),
+    (4.32, 2),  # Fixed range
+    (4.25, 1),
+]
+
+_THIRD_DOWN_RANGES = [
+    (42.5, 9),
+    (41.5, 8),
+    (40.5, 7),
+    (39.5, 6),
+    (38.5, 5),
+    (37.5, 4),
+    (36.5, 3),
+    (35.5, 2),
+    (34.0, 1),
+    (33.5, 1),  # Test middle of 33.0-34.99 range
+    (33.0, 1),  # Test boundary
+]
+
+_SUCCESS_RATE_RANGES = [
+    (46.5, 9),
+    (45.5, 8),
+    (44.5, 7),
+    (43.5, 6),
+    (42.5, 5),
+    (41.5, 4),
+    (40.5, 3),
+]
+
+_FIRST_DOWNS_RANGES = [
+    (25.0, 10),
+    (22.0, 10),
+    (21.5, 9),
+    (20.5, 8),
+    (19.5, 7),
+    (18.5, 6),
+    (17.5, 5),
+    (17.0, 5),  # Test exact boundary
+]
+
+_PPD_RANGES = [
+    (2.37, 9),
+    (2.32, 8),
+    (2.27, 7),
+    (2.22, 6),
+    (2.15, 5),
+    (2.05, 4),
+    (1.95, 3),
+    (1.87, 2),
+    (1.82, 1),
+]
+
+_REDZONE_RANGES = [
+    (62.0, 9),
+    (60.5, 8),
+    (59.5, 7),
+    (58.5, 6),
+    (57.5, 5),
+    (57.0, 5),  # Test exact boundary
+]
+
+_PENALTY_RANGES = [
+    (5, 3),
+    (15, 1),
+    (25, 0),
+    (35, -2),
+    (45, -4),
+    (55, -5),
+    (65, -6),
+    (75, -8),
+    (85, -9),
+]
+
+_VALIDATION_ERRORS = [
+    pytest.param(TOERCalculator.calculate_yards_per_play_score, -1.0, "yards_per_play cannot be negative", id="negative_yards_per_play"),
+    pytest.param(TOERCalculator.calculate_yards_per_play_score, 25.0, "yards_per_play seems unrealistic", id="unrealistic_yards_per_play"),
+    pytest.param(TOERCalculator.calculate_turnovers_score, -1, "turnovers cannot be negative", id="negative_turnovers"),
+    pytest.param(TOERCalculator.calculate_turnovers_score, 15, "turnovers seems unrealistic", id="unrealistic_turnovers"),
+    pytest.param(TOERCalculator.calculate_completion_pct_score, -5.0, "completion_percentage must be between 0 and 100", id="completion_percentage_negative"),
+    pytest.param(TOERCalculator.calculate_completion_pct_score, 105.0, "completion_percentage must be between 0 and 100", id="completion_percentage_over_100"),
+    pytest.param(TOERCalculator.calculate_rush_ypc_score, -2.0, "rush_yards_per_carry cannot be negative", id="negative_rush_ypc"),
+    pytest.param(TOERCalculator.calculate_rush_ypc_score, 20.0, "rush_yards_per_carry seems unrealistic", id="unrealistic_rush_ypc"),
+    pytest.param(TOERCalculator.calculate_sacks_score, -1, "sacks cannot be negative", id="negative_sacks"),
+    pytest.param(TOERCalculator.calculate_sacks_score, 20, "sacks seems unrealistic", id="unrealistic_sacks"),
+    pytest.param(TOERCalculator.calculate_third_down_score, -10.0, "third_down_percentage must be between 0 and 100", id="third_down_percentage_below_zero"),
+    pytest.param(TOERCalculator.calculate_third_down_score, 150.0, "third_down_percentage must be between 0 and 100", id="third_down_percentage_over_100"),
+    pytest.param(TOERCalculator.calculate_success_rate_score, -5.0, "success_rate must be between 0 and 100", id="success_rate_below_zero"),
+    pytest.param(TOERCalculator.calculate_success_rate_score, 110.0, "success_rate must be between 0 and 100", id="success_rate_over_100"),
+    pytest.param(TOERCalculator.calculate_first_downs_score, -3.0, "first_downs cannot be negative", id="negative_first_downs"),
+    pytest.param(TOERCalculator.calculate_first_downs_score, 60.0, "first_downs seems unrealistic", id="unrealistic_first_downs"),
+    pytest.param(TOERCalculator.calculate_ppd_score, -1.0, "points_per_drive cannot be negative", id="negative_points_per_drive"),
+    pytest.param(TOERCalculator.calculate_ppd_score, 10.0, "points_per_drive seems unrealistic", id="unrealistic_points_per_drive"),
+    pytest.param(TOERCalculator.calculate_redzone_score, -10.0, "redzone_td_percentage must be between 0 and 100", id="redzone_percentage_below_zero"),
+    pytest.param(TOERCalculator.calculate_redzone_score, 120.0, "redzone_td_percentage must be between 0 and 100", id="redzone_percentage_over_100"),
+    pytest.param(TOERCalculator.calculate_penalty_yards_adjustment, -5, "penalty_yards cannot be negative", id="negative_penalty_yards"),
+    pytest.param(TOERCalculator.calculate_penalty_yards_adjustment, 350, "penalty_yards seems unrealistic", id="unrealistic_penalty_yards"),
+]
+
+
 class TestTOERCalculatorValidation:
     """Test input validation for all TOER calculator methods."""
     
-    def test_validate_negative_yards_per_play(self):
-        with pytest.raises(TOERValidationError, match="yards_per_play cannot be negative"):
-            TOERCalculator.calculate_yards_per_play_score(-1.0)
-    
-    def test_validate_unrealistic_yards_per_play(self):
-        with pytest.raises(TOERValidationError, match="yards_per_play seems unrealistic"):
-            TOERCalculator.calculate_yards_per_play_score(25.0)
-    
-    def test_validate_negative_turnovers(self):
-        with pytest.raises(TOERValidationError, match="turnovers cannot be negative"):
-            TOERCalculator.calculate_turnovers_score(-1)
-    
-    def test_validate_unrealistic_turnovers(self):
-        with pytest.raises(TOERValidationError, match="turnovers seems unrealistic"):
-            TOERCalculator.calculate_turnovers_score(15)
-    
-    def test_validate_completion_percentage_negative(self):
-        with pytest.raises(TOERValidationError, match="completion_percentage must be between 0 and 100"):
-            TOERCalculator.calculate_completion_pct_score(-5.0)
-    
-    def test_validate_completion_percentage_over_100(self):
-        with pytest.raises(TOERValidationError, match="completion_percentage must be between 0 and 100"):
-            TOERCalculator.calculate_completion_pct_score(105.0)
-    
-    def test_validate_negative_rush_ypc(self):
-        with pytest.raises(TOERValidationError, match="rush_yards_per_carry cannot be negative"):
-            TOERCalculator.calculate_rush_ypc_score(-2.0)
-    
-    def test_validate_unrealistic_rush_ypc(self):
-        with pytest.raises(TOERValidationError, match="rush_yards_per_carry seems unrealistic"):
-            TOERCalculator.calculate_rush_ypc_score(20.0)
-    
-    def test_validate_negative_sacks(self):
-        with pytest.raises(TOERValidationError, match="sacks cannot be negative"):
-            TOERCalculator.calculate_sacks_score(-1)
-    
-    def test_validate_unrealistic_sacks(self):
-        with pytest.raises(TOERValidationError, match="sacks seems unrealistic"):
-            TOERCalculator.calculate_sacks_score(20)
-    
-    def test_validate_third_down_percentage_bounds(self):
-        with pytest.raises(TOERValidationError, match="third_down_percentage must be between 0 and 100"):
-            TOERCalculator.calculate_third_down_score(-10.0)
-        
-        with pytest.raises(TOERValidationError, match="third_down_percentage must be between 0 and 100"):
-            TOERCalculator.calculate_third_down_score(150.0)
-    
-    def test_validate_success_rate_bounds(self):
-        with pytest.raises(TOERValidationError, match="success_rate must be between 0 and 100"):
-            TOERCalculator.calculate_success_rate_score(-5.0)
-        
-        with pytest.raises(TOERValidationError, match="success_rate must be between 0 and 100"):
-            TOERCalculator.calculate_success_rate_score(110.0)
-    
-    def test_validate_negative_first_downs(self):
-        with pytest.raises(TOERValidationError, match="first_downs cannot be negative"):
-            TOERCalculator.calculate_first_downs_score(-3.0)
-    
-    def test_validate_unrealistic_first_downs(self):
-        with pytest.raises(TOERValidationError, match="first_downs seems unrealistic"):
-            TOERCalculator.calculate_first_downs_score(60.0)
-    
-    def test_validate_negative_points_per_drive(self):
-        with pytest.raises(TOERValidationError, match="points_per_drive cannot be negative"):
-            TOERCalculator.calculate_ppd_score(-1.0)
-    
-    def test_validate_unrealistic_points_per_drive(self):
-        with pytest.raises(TOERValidationError, match="points_per_drive seems unrealistic"):
-            TOERCalculator.calculate_ppd_score(10.0)
-    
-    def test_validate_redzone_percentage_bounds(self):
-        with pytest.raises(TOERValidationError, match="redzone_td_percentage must be between 0 and 100"):
-            TOERCalculator.calculate_redzone_score(-10.0)
-        
-        with pytest.raises(TOERValidationError, match="redzone_td_percentage must be between 0 and 100"):
-            TOERCalculator.calculate_redzone_score(120.0)
-    
-    def test_validate_negative_penalty_yards(self):
-        with pytest.raises(TOERValidationError, match="penalty_yards cannot be negative"):
-            TOERCalculator.calculate_penalty_yards_adjustment(-5)
-    
-    def test_validate_unrealistic_penalty_yards(self):
-        with pytest.raises(TOERValidationError, match="penalty_yards seems unrealistic"):
-            TOERCalculator.calculate_penalty_yards_adjustment(350)
+    @pytest.mark.parametrize("fn,arg,match", _VALIDATION_ERRORS)
+    def test_validation_error(self, fn, arg, match):
+        with pytest.raises(TOERValidationError, match=match):
+            fn(arg)
 
 
 class TestYardsPerPlayScoring:
     """Test yards per play scoring logic."""
     
-    def test_excellent_ypp(self):
-        assert TOERCalculator.calculate_yards_per_play_score(6.0) == 10
-        assert TOERCalculator.calculate_yards_per_play_score(5.51) == 10
-    
-    def test_perfect_ypp_boundary(self):
-        assert TOERCalculator.calculate_yards_per_play_score(5.5) == 9
-    
-    def test_ypp_scoring_ranges(self):
-        assert TOERCalculator.calculate_yards_per_play_score(5.47) == 8
-        assert TOERCalculator.calculate_yards_per_play_score(5.42) == 7
-        assert TOERCalculator.calculate_yards_per_play_score(5.37) == 6
-        assert TOERCalculator.calculate_yards_per_play_score(5.32) == 5
-        assert TOERCalculator.calculate_yards_per_play_score(5.27) == 4
-        assert TOERCalculator.calculate_yards_per_play_score(5.22) == 3
-        assert TOERCalculator.calculate_yards_per_play_score(5.17) == 2
-        assert TOERCalculator.calculate_yards_per_play_score(5.12) == 1
-    
-    def test_poor_ypp(self):
-        assert TOERCalculator.calculate_yards_per_play_score(5.05) == 0
-        assert TOERCalculator.calculate_yards_per_play_score(4.0) == 0
-        assert TOERCalculator.calculate_yards_per_play_score(0.0) == 0
-    
-    def test_critical_boundary_precision_issues(self):
+    def test_excellent_ypp(self, calc):
+        assert calc.calculate_yards_per_play_score(6.0) == 10
+        assert calc.calculate_yards_per_play_score(5.51) == 10
+    
+    def test_perfect_ypp_boundary(self, calc):
+        assert calc.calculate_yards_per_play_score(5.5) == 9
+    
+    def test_ypp_scoring_ranges(self, calc):
+        assert calc.calculate_yards_per_play_score(5.47) == 8
+        assert calc.calculate_yards_per_play_score(5.42) == 7
+        assert calc.calculate_yards_per_play_score(5.37) == 6
+        assert calc.calculate_yards_per_play_score(5.32) == 5
+        assert calc.calculate_yards_per_play_score(5.27) == 4
+        assert calc.calculate_yards_per_play_score(5.22) == 3
+        assert calc.calculate_yards_per_play_score(5.17) == 2
+        assert calc.calculate_yards_per_play_score(5.12) == 1
+    
+    def test_poor_ypp(self, calc):
+        assert calc.calculate_yards_per_play_score(5.05) == 0
+        assert calc.calculate_yards_per_play_score(4.0) == 0
+        assert calc.calculate_yards_per_play_score(0.0) == 0
+    
+    def test_critical_boundary_precision_issues(self, calc):
         """Test the exact boundary precision issue that was discovered with Arizona Cardinals."""
         # This is the EXACT value that failed - 5.509090909090909
         # After rounding fix: rounds to 5.51 and should score 10 points
-        assert TOERCalculator.calculate_yards_per_play_score(5.509090909090909) == 10
+        assert calc.calculate_yards_per_play_score(5.509090909090909) == 10
         
         # Test display consistency - values that display the same should score the same
         # All these round to 5.50 when displayed, so should have same score
-        assert TOERCalculator.calculate_yards_per_play_score(5.504) == 9   # rounds to 5.50
-        assert TOERCalculator.calculate_yards_per_play_score(5.500) == 9   # exactly 5.50
-        assert TOERCalculator.calculate_yards_per_play_score(5.496) == 9   # rounds to 5.50
+        assert calc.calculate_yards_per_play_score(5.504) == 9   # rounds to 5.50
+        assert calc.calculate_yards_per_play_score(5.500) == 9   # exactly 5.50
+        assert calc.calculate_yards_per_play_score(5.496) == 9   # rounds to 5.50
         
         # Values that round to different displays should potentially score differently
-        assert TOERCalculator.calculate_yards_per_play_score(5.51) == 10   # displays as 5.51
-        assert TOERCalculator.calculate_yards_per_play_score(5.49) == 8    # displays as 5.49
-        
-        # Test all critical boundaries with floating point precision
-        boundaries = [
-            (5.51, 10),  # > 5.5
-            (5.50, 9),   # 5.5
-            (5.49, 8),   # 5.45-5.49
-            (5.45, 8),
-            (5.44, 7),   # 5.40-5.44
-            (5.40, 7),
-            (5.39, 6),   # 5.35-5.39
-            (5.35, 6),
-            (5.34, 5),   # 5.30-5.34
-            (5.30, 5),
-            (5.29, 4),   # 5.25-5.29
-            (5.25, 4),
-            (5.24, 3),   # 5.20-5.24
-            (5.20, 3),
-            (5.19, 2),   # 5.15-5.19
-            (5.15, 2),
-            (5.14, 1),   # 5.10-5.14
-            (5.10, 1),
-            (5.09, 0),   # < 5.10
-        ]
-        
-        for value, expected_score in boundaries:
-            assert TOERCalculator.calculate_yards_per_play_score(value) == expected_score, \
-                f"YPP {value} should score {expected_score}"
+        assert calc.calculate_yards_per_play_score(5.51) == 10   # displays as 5.51
+        assert calc.calculate_yards_per_play_score(5.49) == 8    # displays as 5.49
     
-    def test_real_world_ypp_values(self):
+    @pytest.mark.parametrize("value,expected", _YPP_BOUNDARIES)
+    def test_ypp_boundary(self, calc, value, expected):
+        """Test all critical boundaries with floating point precision."""
+        assert calc.calculate_yards_per_play_score(value) == expected
+    
+    @pytest.mark.parametrize("ypp,expected", _REAL_WORLD_YPP)
+    def test_real_world_ypp_values(self, calc, ypp, expected):
         """Test with actual YPP values that could occur in real games."""
-        # These are realistic YPP values from actual games
-        real_values = [
-            (121 / 22, 9),    # 5.5 exactly (121 yards on 22 plays) - scores 9
-            (385 / 70, 9),    # 5.5 exactly (385 yards on 70 plays) - scores 9
-            (484 / 88, 9),    # 5.5 exactly (484 yards on 88 plays) - scores 9
-            (606 / 110, 10),  # 5.509090909090909 - The Arizona Cardinals case! - scores 10
-            (371 / 68, 8),    # 5.455882352941177
-            (299 / 55, 7),    # 5.436363636363636
-            (412 / 76, 7),    # 5.421052631578947
-            (287 / 53, 7),    # 5.415094339622641
-            (325 / 61, 5),    # 5.327868852459016
-            (380 / 72, 4),    # 5.277777777777778
-            (295 / 57, 2),    # 5.175438596491228
-            (301 / 59, 1),    # 5.101694915254237
-        ]
-        
-        for yards_plays_tuple, expected_score in real_values:
-            ypp = yards_plays_tuple
-            actual_score = TOERCalculator.calculate_yards_per_play_score(ypp)
-            assert actual_score == expected_score, \
-                f"YPP {ypp:.15f} should score {expected_score}, got {actual_score}"
+        assert calc.calculate_yards_per_play_score(ypp) == expected, \
+            f"YPP {ypp:.15f} should score {expected}"
 
 
 class TestTurnoverScoring:
     """Test turnover scoring logic."""
     
-    def test_no_turnovers(self):
-        assert TOERCalculator.calculate_turnovers_score(0) == 10
+    def test_no_turnovers(self, calc):
+        assert calc.calculate_turnovers_score(0) == 10
     
-    def test_turnover_scoring_progression(self):
-        assert TOERCalculator.calculate_turnovers_score(1) == 5
-        assert TOERCalculator.calculate_turnovers_score(2) == 0
-        assert TOERCalculator.calculate_turnovers_score(3) == -3
-        assert TOERCalculator.calculate_turnovers_score(4) == -4
+    def test_turnover_scoring_progression(self, calc):
+        assert calc.calculate_turnovers_score(1) == 5
+        assert calc.calculate_turnovers_score(2) == 0
+        assert calc.calculate_turnovers_score(3) == -3
+        assert calc.calculate_turnovers_score(4) == -4
     
-    def test_many_turnovers(self):
-        assert TOERCalculator.calculate_turnovers_score(5) == -5
-        assert TOERCalculator.calculate_turnovers_score(10) == -5
+    def test_many_turnovers(self, calc):
+        assert calc.calculate_turnovers_score(5) == -5
+        assert calc.calculate_turnovers_score(10) == -5
 
 
 class TestCompletionPercentageScoring:
     """Test completion percentage scoring logic."""
     
-    def test_excellent_completion_rate(self):
-        assert TOERCalculator.calculate_completion_pct_score(70.0) == 10
-        assert TOERCalculator.calculate_completion_pct_score(67.5) == 10
+    def test_excellent_completion_rate(self, calc):
+        assert calc.calculate_completion_pct_score(70.0) == 10
+        assert calc.calculate_completion_pct_score(67.5) == 10
     
-    def test_completion_percentage_ranges(self):
-        assert TOERCalculator.calculate_completion_pct_score(67.25) == 9
-        assert TOERCalculator.calculate_completion_pct_score(66.75) == 8
-        assert TOERCalculator.calculate_completion_pct_score(66.25) == 7
-        assert TOERCalculator.calculate_completion_pct_score(65.75) == 6
-        assert TOERCalculator.calculate_completion_pct_score(65.25) == 5
-        assert TOERCalculator.calculate_completion_pct_score(64.75) == 4
-        assert TOERCalculator.calculate_completion_pct_score(64.25) == 3
-        assert TOERCalculator.calculate_completion_pct_score(63.75) == 2
-        assert TOERCalculator.calculate_completion_pct_score(63.25) == 1
+    @pytest.mark.parametrize("value,expected", _COMPLETION_PCT_RANGES)
+    def test_completion_percentage_ranges(self, calc, value, expected):
+        assert calc.calculate_completion_pct_score(value) == expected
     
-    def test_poor_completion_rate(self):
-        assert TOERCalculator.calculate_completion_pct_score(62.0) == 0
-        assert TOERCalculator.calculate_completion_pct_score(50.0) == 0
+    def test_poor_completion_rate(self, calc):
+        assert calc.calculate_completion_pct_score(62.0) == 0
+        assert calc.calculate_completion_pct_score(50.0) == 0
 
 
 class TestRushYPCScoring:
     """Test rushing yards per carry scoring logic."""
     
-    def test_excellent_rush_ypc(self):
-        assert TOERCalculator.calculate_rush_ypc_score(5.0) == 10
-        assert TOERCalculator.calculate_rush_ypc_score(4.7) == 10
+    def test_excellent_rush_ypc(self, calc):
+        assert calc.calculate_rush_ypc_score(5.0) == 10
+        assert calc.calculate_rush_ypc_score(4.7) == 10
     
-    def test_rush_ypc_ranges(self):
-        assert TOERCalculator.calculate_rush_ypc_score(4.67) == 9
-        assert TOERCalculator.calculate_rush_ypc_score(4.62) == 8
-        assert TOERCalculator.calculate_rush_ypc_score(4.57) == 7
-        assert TOERCalculator.calculate_rush_ypc_score(4.52) == 6
-        assert TOERCalculator.calculate_rush_ypc_score(4.47) == 5
-        assert TOERCalculator.calculate_rush_ypc_score(4.42) == 4
-        assert TOERCalculator.calculate_rush_ypc_score(4.37) == 3
-        assert TOERCalculator.calculate_rush_ypc_score(4.32) == 2  # Fixed range
-        assert TOERCalculator.calculate_rush_ypc_score(4.25) == 1
+    @pytest.mark.parametrize("value,expected", _RUSH_YPC_RANGES)
+    def test_rush_ypc_ranges(self, calc, value, expected):
+        assert calc.calculate_rush_ypc_score(value) == expected
     
-    def test_poor_rush_ypc(self):
-        assert TOERCalculator.calculate_rush_ypc_score(4.15) == 0
-        assert TOERCalculator.calculate_rush_ypc_score(3.0) == 0
-        assert TOERCalculator.calculate_rush_ypc_score(0.0) == 0
+    def test_poor_rush_ypc(self, calc):
+        assert calc.calculate_rush_ypc_score(4.15) == 0
+        assert calc.calculate_rush_ypc_score(3.0) == 0
+        assert calc.calculate_rush_ypc_score(0.0) == 0
 
 
 class TestSacksScoring:
     """Test sacks allowed scoring logic."""
     
-    def test_no_sacks(self):
-        assert TOERCalculator.calculate_sacks_score(0) == 10
+    def test_no_sacks(self, calc):
+        assert calc.calculate_sacks_score(0) == 10
     
-    def test_sacks_scoring_progression(self):
-        assert TOERCalculator.calculate_sacks_score(1) == 8
-        assert TOERCalculator.calculate_sacks_score(2) == 5
-        assert TOERCalculator.calculate_sacks_score(3) == 0
-        assert TOERCalculator.calculate_sacks_score(4) == -1
+    def test_sacks_scoring_progression(self, calc):
+        assert calc.calculate_sacks_score(1) == 8
+        assert calc.calculate_sacks_score(2) == 5
+        assert calc.calculate_sacks_score(3) == 0
+        assert calc.calculate_sacks_score(4) == -1
     
-    def test_many_sacks(self):
-        assert TOERCalculator.calculate_sacks_score(5) == -3
-        assert TOERCalculator.calculate_sacks_score(10) == -3
+    def test_many_sacks(self, calc):
+        assert calc.calculate_sacks_score(5) == -3
+        assert calc.calculate_sacks_score(10) == -3
 
 
 class TestThirdDownScoring:
     """Test third down conversion scoring logic."""
     
-    def test_excellent_third_down_rate(self):
-        assert TOERCalculator.calculate_third_down_score(45.0) == 10
-        assert TOERCalculator.calculate_third_down_score(43.0) == 10
-    
-    def test_third_down_ranges(self):
-        assert TOERCalculator.calculate_third_down_score(42.5) == 9
-        assert TOERCalculator.calculate_third_down_score(41.5) == 8
-        assert TOERCalculator.calculate_third_down_score(40.5) == 7
-        assert TOERCalculator.calculate_third_down_score(39.5) == 6
-        assert TOERCalculator.calculate_third_down_score(38.5) == 5
-        assert TOERCalculator.calculate_third_down_score(37.5) == 4
-        assert TOERCalculator.calculate_third_down_score(36.5) == 3
-        assert TOERCalculator.calculate_third_down_score(35.5) == 2
-        assert TOERCalculator.calculate_third_down_score(34.0) == 1
-        assert TOERCalculator.calculate_third_down_score(33.5) == 1  # Test middle of 33.0-34.99 range
-        assert TOERCalculator.calculate_third_down_score(33.0) == 1  # Test boundary
-    
-    def test_poor_third_down_rate(self):
-        assert TOERCalculator.calculate_third_down_score(32.99) == 0  # Test just below 33.0
-        assert TOERCalculator.calculate_third_down_score(32.0) == 0
-        assert TOERCalculator.calculate_third_down_score(25.0) == 0
-        assert TOERCalculator.calculate_third_down_score(10.0) == 0
+    def test_excellent_third_down_rate(self, calc):
+        assert calc.calculate_third_down_score(45.0) == 10
+        assert calc.calculate_third_down_score(43.0) == 10
+    
+    @pytest.mark.parametrize("value,expected", _THIRD_DOWN_RANGES)
+    def test_third_down_ranges(self, calc, value, expected):
+        assert calc.calculate_third_down_score(value) == expected
+    
+    def test_poor_third_down_rate(self, calc):
+        assert calc.calculate_third_down_score(32.99) == 0  # Test just below 33.0
+        assert calc.calculate_third_down_score(32.0) == 0
+        assert calc.calculate_third_down_score(25.0) == 0
+        assert calc.calculate_third_down_score(10.0) == 0
 
 
 class TestSuccessRateScoring:
     """Test success rate scoring logic."""
     
-    def test_excellent_success_rate(self):
-        assert TOERCalculator.calculate_success_rate_score(50.0) == 10
-        assert TOERCalculator.calculate_success_rate_score(47.0) == 10
+    def test_excellent_success_rate(self, calc):
+        assert calc.calculate_success_rate_score(50.0) == 10
+        assert calc.calculate_success_rate_score(47.0) == 10
     
-    def test_success_rate_ranges(self):
-        assert TOERCalculator.calculate_success_rate_score(46.5) == 9
-        assert TOERCalculator.calculate_success_rate_score(45.5) == 8
-        assert TOERCalculator.calculate_success_rate_score(44.5) == 7
-        assert TOERCalculator.calculate_success_rate_score(43.5) == 6
-        assert TOERCalculator.calculate_success_rate_score(42.5) == 5
-        assert TOERCalculator.calculate_success_rate_score(41.5) == 4
-        assert TOERCalculator.calculate_success_rate_score(40.5) == 3
+    @pytest.mark.parametrize("value,expected", _SUCCESS_RATE_RANGES)
+    def test_success_rate_ranges(self, calc, value, expected):
+        assert calc.calculate_success_rate_score(value) == expected
     
-    def test_poor_success_rate(self):
-        assert TOERCalculator.calculate_success_rate_score(39.99) == 0  # Test just below 40.0
-        assert TOERCalculator.calculate_success_rate_score(39.0) == 0
-        assert TOERCalculator.calculate_success_rate_score(35.0) == 0
-        assert TOERCalculator.calculate_success_rate_score(30.0) == 0
-        assert TOERCalculator.calculate_success_rate_score(20.0) == 0
-        assert TOERCalculator.calculate_success_rate_score(10.0) == 0
+    def test_poor_success_rate(self, calc):
+        assert calc.calculate_success_rate_score(39.99) == 0  # Test just below 40.0
+        assert calc.calculate_success_rate_score(39.0) == 0
+        assert calc.calculate_success_rate_score(35.0) == 0
+        assert calc.calculate_success_rate_score(30.0) == 0
+        assert calc.calculate_success_rate_score(20.0) == 0
+        assert calc.calculate_success_rate_score(10.0) == 0
 
 
 class TestFirstDownsScoring:
     """Test first downs scoring logic."""
     
-    def test_first_downs_ranges(self):
-        assert TOERCalculator.calculate_first_downs_score(25.0) == 10
-        assert TOERCalculator.calculate_first_downs_score(22.0) == 10
-        assert TOERCalculator.calculate_first_downs_score(21.5) == 9
-        assert TOERCalculator.calculate_first_downs_score(20.5) == 8
-        assert TOERCalculator.calculate_first_downs_score(19.5) == 7
-        assert TOERCalculator.calculate_first_downs_score(18.5) == 6
-        assert TOERCalculator.calculate_first_downs_score(17.5) == 5
-        assert TOERCalculator.calculate_first_downs_score(17.0) == 5  # Test exact boundary
+    @pytest.mark.parametrize("value,expected", _FIRST_DOWNS_RANGES)
+    def test_first_downs_ranges(self, calc, value, expected):
+        assert calc.calculate_first_downs_score(value) == expected
     
-    def test_poor_first_downs(self):
-        assert TOERCalculator.calculate_first_downs_score(16.99) == 0  # Test just below 17.0
-        assert TOERCalculator.calculate_first_downs_score(16.0) == 0
-        assert TOERCalculator.calculate_first_downs_score(12.0) == 0
-        assert TOERCalculator.calculate_first_downs_score(10.0) == 0
-        assert TOERCalculator.calculate_first_downs_score(5.0) == 0
+    def test_poor_first_downs(self, calc):
+        assert calc.calculate_first_downs_score(16.99) == 0  # Test just below 17.0
+        assert calc.calculate_first_downs_score(16.0) == 0
+        assert calc.calculate_first_downs_score(12.0) == 0
+        assert calc.calculate_first_downs_score(10.0) == 0
+        assert calc.calculate_first_downs_score(5.0) == 0
 
 
 class TestPointsPerDriveScoring:
     """Test points per drive scoring logic."""
     
-    def test_excellent_ppd(self):
-        assert TOERCalculator.calculate_ppd_score(3.0) == 10
-        assert TOERCalculator.calculate_ppd_score(2.4) == 10
+    def test_excellent_ppd(self, calc):
+        assert calc.calculate_ppd_score(3.0) == 10
+        assert calc.calculate_ppd_score(2.4) == 10
     
-    def test_ppd_ranges(self):
-        assert TOERCalculator.calculate_ppd_score(2.37) == 9
-        assert TOERCalculator.calculate_ppd_score(2.32) == 8
-        assert TOERCalculator.calculate_ppd_score(2.27) == 7
-        assert TOERCalculator.calculate_ppd_score(2.22) == 6
-        assert TOERCalculator.calculate_ppd_score(2.15) == 5
-        assert TOERCalculator.calculate_ppd_score(2.05) == 4
-        assert TOERCalculator.calculate_ppd_score(1.95) == 3
-        assert TOERCalculator.calculate_ppd_score(1.87) == 2
-        assert TOERCalculator.calculate_ppd_score(1.82) == 1
+    @pytest.mark.parametrize("value,expected", _PPD_RANGES)
+    def test_ppd_ranges(self, calc, value, expected):
+        assert calc.calculate_ppd_score(value) == expected
     
-    def test_poor_ppd(self):
-        assert TOERCalculator.calculate_ppd_score(1.75) == 0
-        assert TOERCalculator.calculate_ppd_score(1.0) == 0
+    def test_poor_ppd(self, calc):
+        assert calc.calculate_ppd_score(1.75) == 0
+        assert calc.calculate_ppd_score(1.0) == 0
 
 
 class TestRedZoneScoring:
     """Test red zone touchdown percentage scoring logic."""
     
-    def test_excellent_redzone_rate(self):
-        assert TOERCalculator.calculate_redzone_score(70.0) == 10
-        assert TOERCalculator.calculate_redzone_score(63.0) == 10
+    def test_excellent_redzone_rate(self, calc):
+        assert calc.calculate_redzone_score(70.0) == 10
+        assert calc.calculate_redzone_score(63.0) == 10
     
-    def test_redzone_ranges(self):
-        assert TOERCalculator.calculate_redzone_score(62.0) == 9
-        assert TOERCalculator.calculate_redzone_score(60.5) == 8
-        assert TOERCalculator.calculate_redzone_score(59.5) == 7
-        assert TOERCalculator.calculate_redzone_score(58.5) == 6
-        assert TOERCalculator.calculate_redzone_score(57.5) == 5
-        assert TOERCalculator.calculate_redzone_score(57.0) == 5  # Test exact boundary
+    @pytest.mark.parametrize("value,expected", _REDZONE_RANGES)
+    def test_redzone_ranges(self, calc, value, expected):
+        assert calc.calculate_redzone_score(value) == expected
     
-    def test_poor_redzone_rate(self):
-        assert TOERCalculator.calculate_redzone_score(56.99) == 0  # Test just below 57.0
-        assert TOERCalculator.calculate_redzone_score(56.0) == 0
-        assert TOERCalculator.calculate_redzone_score(50.0) == 0
-        assert TOERCalculator.calculate_redzone_score(40.0) == 0
-        assert TOERCalculator.calculate_redzone_score(30.0) == 0
-        assert TOERCalculator.calculate_redzone_score(20.0) == 0
+    def test_poor_redzone_rate(self, calc):
+        assert calc.calculate_redzone_score(56.99) == 0  # Test just below 57.0
+        assert calc.calculate_redzone_score(56.0) == 0
+        assert calc.calculate_redzone_score(50.0) == 0
+        assert calc.calculate_redzone_score(40.0) == 0
+        assert calc.calculate_redzone_score(30.0) == 0
+        assert calc.calculate_redzone_score(20.0) == 0
 
 
 class TestPenaltyYardsAdjustment:
     """Test penalty yards adjustment scoring logic."""
     
-    def test_no_penalties(self):
-        assert TOERCalculator.calculate_penalty_yards_adjustment(0) == 5
+    def test_no_penalties(self, calc):
+        assert calc.calculate_penalty_yards_adjustment(0) == 5
     
-    def test_penalty_ranges(self):
-        assert TOERCalculator.calculate_penalty_yards_adjustment(5) == 3
-        assert TOERCalculator.calculate_penalty_yards_adjustment(15) == 1
-        assert TOERCalculator.calculate_penalty_yards_adjustment(25) == 0
-        assert TOERCalculator.calculate_penalty_yards_adjustment(35) == -2
-        assert TOERCalculator.calculate_penalty_yards_adjustment(45) == -4
-        assert TOERCalculator.calculate_penalty_yards_adjustment(55) == -5
-        assert TOERCalculator.calculate_penalty_yards_adjustment(65) == -6
-        assert TOERCalculator.calculate_penalty_yards_adjustment(75) == -8
-        assert TOERCalculator.calculate_penalty_yards_adjustment(85) == -9
+    @pytest.mark.parametrize("value,expected", _PENALTY_RANGES)
+    def test_penalty_ranges(self, calc, value, expected):
+        assert calc.calculate_penalty_yards_adjustment(value) == expected
     
-    def test_many_penalty_yards(self):
-        assert TOERCalculator.calculate_penalty_yards_adjustment(95) == -10
-        assert TOERCalculator.calculate_penalty_yards_adjustment(150) == -10
+    def test_many_penalty_yards(self, calc):
+        assert calc.calculate_penalty_yards_adjustment(95) == -10
+        assert calc.calculate_penalty_yards_adjustment(150) == -10
+
+
+class TestScoringLookupTables:
+    """Test that precomputed lookup tables agree with the configured thresholds."""
+    
+    def test_tables_match_threshold_scorers(self, calc):
+        scorers = calc._build_scorers()
+        tables = calc._build_tables()
+        for metric_name, (max_value, scale) in calc._TABLE_DOMAINS.items():
+            table = tables[metric_name]
+            assert len(table) == int(max_value * scale) + 1
+            for index, score in enumerate(table):
+                assert score == scorers[metric_name](index / scale), \
+                    f"{metric_name} at {index / scale} should score {scorers[metric_name](index / scale)}"
+    
+    def test_fractional_penalty_yards_use_thresholds(self, calc):
+        assert calc.calculate_penalty_yards_adjustment(10.5) == 1
+        assert calc.calculate_penalty_yards_adjustment(0.5) == 3
 
 
 class TestTOERCalculation:
     """Test the main TOER calculation method."""
     
-    def test_perfect_game_toer(self):
+    def test_perfect_game_toer(self, calc):
         """Test TOER calculation for a perfect offensive game."""
-        toer = TOERCalculator.calculate_toer(
+        toer = calc.calculate_toer(
             avg_yards_per_play=6.0,      # 10 points
             turnovers=0,                 # 10 points
             completion_pct=70.0,         # 10 points
@@ -435,9 +445,9 @@ class TestTOERCalculation:
         # Base: 100, Penalty: +5, Capped at 100
         assert toer == 100.0
     
-    def test_average_game_toer(self):
+    def test_average_game_toer(self, calc):
         """Test TOER calculation for an average offensive game."""
-        toer = TOERCalculator.calculate_toer(
+        toer = calc.calculate_toer(
             avg_yards_per_play=5.3,      # 5 points
             turnovers=2,                 # 0 points
             completion_pct=65.0,         # 5 points
@@ -453,9 +463,9 @@ class TestTOERCalculation:
         # Base: 41, Penalty: -4, Total: 37
         assert toer == 37.0
     
-    def test_terrible_game_toer(self):
+    def test_terrible_game_toer(self, calc):
         """Test TOER calculation for a terrible offensive game."""
-        toer = TOERCalculator.calculate_toer(
+        toer = calc.calculate_toer(
             avg_yards_per_play=4.0,      # 0 points
             turnovers=5,                 # -5 points
             completion_pct=50.0,         # 0 points
@@ -471,10 +481,10 @@ class TestTOERCalculation:
         # Base: -8, Penalty: -10, Total: -18, Capped at 0
         assert toer == 0.0
     
-    def test_toer_boundary_values(self):
+    def test_toer_boundary_values(self, calc):
         """Test TOER calculation at various boundary values."""
         # Test exact boundary values for different components
-        toer = TOERCalculator.calculate_toer(
+        toer = calc.calculate_toer(
             avg_yards_per_play=5.5,      # 9 points (exact boundary)
             turnovers=1,                 # 5 points
             completion_pct=67.5,         # 10 points (exact boundary)
@@ -490,10 +500,43 @@ class TestTOERCalculation:
         # Base: 92, Penalty: +5, Total: 97
         assert toer == 97.0
     
-    def test_toer_with_invalid_inputs_during_calculation(self):
+    @pytest.mark.parametrize("game", [
+        (5.51, 0, 67.5, 4.7, 0, 43.0, 47.0, 22.0, 2.4, 63.0, 0),   # top bucket shortcut
+        (5.505, 0, 67.5, 4.7, 0, 43.0, 47.0, 22.0, 2.4, 63.0, 0),  # rounds up, full scoring
+        (5.5, 0, 67.5, 4.7, 0, 43.0, 47.0, 22.0, 2.4, 63.0, 0),    # 9 + 9 * 10 + 5, capped
+        (5.5, 1, 67.5, 4.7, 1, 43.0, 47.0, 22.0, 2.4, 63.0, 0),    # below the cap
+    ])
+    def test_perfect_game_shortcut_matches_full_scoring(self, calc, game, monkeypatch):
+        toer = calc.calculate_toer(*game)
+        monkeypatch.setattr(calc, "_perfect_bounds", None)
+        assert toer == calc.calculate_toer(*game)
+    
+    @pytest.mark.parametrize("game", [
+        (5.3, 2, 65.0, 4.4, 3, 38.0, 42.0, 18.0, 2.1, 58.0, 50),
+        (5.495, 1, 66.995, 4.645, 2, 40.0, 45.0, 20.0, 2.2, 60.0, 30),  # half-hundredths
+        (5.3, 2.5, 65.0, 4.4, 3, 38.0, 42.0, 18.0, 2.1, 58.0, 10.5),    # fractional counts
+        (5.3, 2, float("nan"), 4.4, 3, 38.0, 42.0, 18.0, 2.1, 58.0, 50),  # NaN rate
+    ])
+    def test_toer_matches_component_methods(self, calc, game):
+        components = [
+            calc.calculate_yards_per_play_score(game[0]),
+            calc.calculate_turnovers_score(game[1]),
+            calc.calculate_completion_pct_score(game[2]),
+            calc.calculate_rush_ypc_score(game[3]),
+            calc.calculate_sacks_score(game[4]),
+            calc.calculate_third_down_score(game[5]),
+            calc.calculate_success_rate_score(game[6]),
+            calc.calculate_first_downs_score(game[7]),
+            calc.calculate_ppd_score(game[8]),
+            calc.calculate_redzone_score(game[9]),
+            calc.calculate_penalty_yards_adjustment(game[10]),
+        ]
+        assert calc.calculate_toer(*game) == max(0, min(100, sum(components)))
+    
+    def test_toer_with_invalid_inputs_during_calculation(self, calc):
         """Test that TOER calculation handles validation errors by returning 0."""
         # The calculate_toer method catches all exceptions and returns 0.0
-        toer = TOERCalculator.calculate_toer(
+        toer = calc.calculate_toer(
             avg_yards_per_play=-1.0,  # Invalid negative value
             turnovers=0,
             completion_pct=65.0,
@@ -508,18 +551,84 @@ class TestTOERCalculation:
         )
         assert toer == 0.0
     
-    def test_individual_methods_raise_validation_errors(self):
+    def test_individual_methods_raise_validation_errors(self, calc):
         """Test that individual scoring methods raise validation errors properly."""
         with pytest.raises(TOERValidationError):
-            TOERCalculator.calculate_yards_per_play_score(-1.0)
+            calc.calculate_yards_per_play_score(-1.0)
+
+
+class TestTOERBatchCalculation:
+    """Test batch TOER calculation against the scalar path."""
+    
+    GAMES = [
+        (6.0, 0, 70.0, 5.0, 0, 50.0, 50.0, 25.0, 3.0, 70.0, 0),
+        (5.3, 2, 65.0, 4.4, 3, 38.0, 42.0, 18.0, 2.1, 58.0, 50),
+        (4.0, 5, 50.0, 3.0, 6, 25.0, 30.0, 12.0, 1.0, 40.0, 100),
+        (606 / 110, 1, 67.5, 4.7, 1, 43.0, 47.0, 22.0, 2.4, 63.0, 0),
+        (5.495, 1, 66.995, 4.645, 2, 40.0, 45.0, 20.0, 2.2, 60.0, 30),
+        (-1.0, 0, 65.0, 4.5, 2, 40.0, 45.0, 20.0, 2.2, 60.0, 30),
+        (5.3, 2, 65.0, 4.4, 3, 38.0, 42.0, 18.0, 2.1, 58.0, 10.5),
+    ]
+    
+    def test_kernel_matches_calculate_toer(self, calc):
+        features = np.array(self.GAMES, dtype=np.float64)
+        toer = toer_columns(features, *calc._build_packed_tables())
+        expected = [calc.calculate_toer(*game) for game in self.GAMES]
+        # Invalid and fractional-count rows are left for the scalar path
+        assert np.isnan(toer[-2:]).all()
+        assert toer[:-2].tolist() == expected[:-2]
+    
+    def test_vectorized_matches_calculate_toer(self, calc):
+        columns = np.array(self.GAMES, dtype=np.float64).T
+        toer = calc.calculate_toer_vectorized(*columns)
+        assert toer.tolist() == [calc.calculate_toer(*game) for game in self.GAMES]
+    
+    def test_batch_matches_calculate_toer(self, calc):
+        toer = calc.calculate_toer_batch(np.array(self.GAMES))
+        assert toer.tolist() == [calc.calculate_toer(*game) for game in self.GAMES]
+    
+    def test_numpy_tie_values_match_calculate_toer(self, calc):
+        # Half-hundredths computed in float64 sit just off the tie, where NumPy's
+        # round() and Python's round() disagree (43.995 -> 44.0 vs 43.99)
+        features = np.tile(np.array(self.GAMES[1], dtype=np.float64), (4, 1))
+        features[0, 0] = np.float64(1091) / 200
+        features[1, 2] = np.float64(8799) / 200
+        features[2, 3] = np.float64(929) / 200
+        features[3, 8] = np.float64(449) / 200
+        toer = calc.calculate_toer_batch(features)
+        assert toer.tolist() == [calc.calculate_toer(*row) for row in features]
+        assert toer.tolist() == [calc.calculate_toer(*row.tolist()) for row in features]
+    
+    def test_vectorized_numpy_tie_values_match_calculate_toer(self, calc):
+        columns = [np.full(4, value, dtype=np.float64) for value in self.GAMES[1]]
+        columns[0][0] = np.float64(1019) / 200   # 5.095 -> 5.09
+        columns[2][1] = np.float64(12599) / 200  # 62.995 -> 62.99
+        columns[5][2] = np.float64(8199) / 200   # 40.995 -> 40.99
+        columns[8][3] = np.float64(359) / 200    # 1.795 -> 1.79
+        toer = calc.calculate_toer_vectorized(*columns)
+        assert toer.tolist() == [calc.calculate_toer(*game) for game in zip(*columns)]
+    
+    def test_component_scores_ignore_numpy_scalar_rounding(self, calc):
+        # 62.995 must round to 62.99, one bucket below the 63.0 boundary
+        value = np.float64(12599) / 200
+        assert calc.calculate_completion_pct_score(value) == calc.calculate_completion_pct_score(float(value)) == 0
+    
+    def test_display_indices_match_round(self):
+        values = [0.125, 2.675, 5.455, 5.495, 5.509090909090909, 66.995, 100.0]
+        expected = [int(round(round(value, 2) * 100)) for value in values]
+        assert display_indices(np.array(values), 100.0).tolist() == expected
+    
+    def test_batch_rejects_wrong_shape(self, calc):
+        with pytest.raises(TOERValidationError, match="features must have shape"):
+            calc.calculate_toer_batch(np.zeros((2, 10)))
 
 
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
     
-    def test_zero_values(self):
+    def test_zero_values(self, calc):
         """Test all zero values (where valid)."""
-        toer = TOERCalculator.calculate_toer(
+        toer = calc.calculate_toer(
             avg_yards_per_play=0.0,      # 0 points
             turnovers=0,                 # 10 points
             completion_pct=0.0,          # 0 points
@@ -535,9 +644,9 @@ class TestEdgeCases:
         # Base: 20, Penalty: +5, Total: 25
         assert toer == 25.0
     
-    def test_maximum_valid_values(self):
+    def test_maximum_valid_values(self, calc):
         """Test with maximum reasonable values."""
-        toer = TOERCalculator.calculate_toer(
+        toer = calc.calculate_toer(
             avg_yards_per_play=15.0,     # 10 points
             turnovers=0,                 # 10 points
             completion_pct=100.0,        # 10 points
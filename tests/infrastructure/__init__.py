@@ -0,0 +1 @@
+# Empty file to make tests.infrastructure a Python package
\ No newline at end of file
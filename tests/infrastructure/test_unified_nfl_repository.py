@@ -0,0 +1,144 @@
+# tests/infrastructure/test_unified_nfl_repository.py
+
+"""
+Unit tests for UnifiedNFLRepository's local play-by-play disk cache.
+Tests the TTL, the write-then-rename save, clearing, and the caching toggle.
+"""
+
+import os
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("nfl_data_py")
+
+from src.infrastructure.data import unified_nfl_repository
+from src.infrastructure.data.unified_nfl_repository import UnifiedNFLRepository
+
+
+PLAYS = pd.DataFrame({
+    'season': [2023, 2023, 2023],
+    'game_date': ['2023-09-10', '2023-09-10', '2023-09-17'],
+    'yards_gained': [5.0, -2.0, 12.0],
+})
+
+
+@pytest.fixture
+def disk_cache_dir(tmp_path, monkeypatch):
+    """Point the repository's disk cache at a per-test directory."""
+    monkeypatch.setattr(UnifiedNFLRepository, 'DISK_CACHE_DIR', tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def repo(disk_cache_dir):
+    return UnifiedNFLRepository()
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    """Replace the nflverse download with PLAYS and record each call."""
+    calls = []
+
+    def import_pbp_data(years, columns=None):
+        calls.append(years)
+        return PLAYS.copy()
+
+    monkeypatch.setattr(unified_nfl_repository.nfl, 'import_pbp_data', import_pbp_data)
+    return calls
+
+
+class TestDiskCacheReadWrite:
+    """Test saving and loading the local parquet copy."""
+
+    def test_round_trip(self, repo, disk_cache_dir):
+        repo._write_disk_cache(2023, PLAYS)
+        pd.testing.assert_frame_equal(repo._read_disk_cache(2023), PLAYS)
+        # The temporary file is renamed into place, not left behind
+        assert [path.name for path in disk_cache_dir.iterdir()] == ['pbp_2023.parquet']
+
+    def test_missing_copy(self, repo):
+        assert repo._read_disk_cache(2023) is None
+
+    def test_expired_copy_is_ignored(self, repo):
+        repo._write_disk_cache(2023, PLAYS)
+        stale = time.time() - repo.DISK_CACHE_TTL - 1
+        os.utime(repo._disk_cache_path(2023), (stale, stale))
+        assert repo._read_disk_cache(2023) is None
+
+    def test_copy_within_ttl_is_used(self, repo):
+        repo._write_disk_cache(2023, PLAYS)
+        recent = time.time() - repo.DISK_CACHE_TTL + 60
+        os.utime(repo._disk_cache_path(2023), (recent, recent))
+        assert repo._read_disk_cache(2023) is not None
+
+    def test_empty_data_is_not_written(self, repo, disk_cache_dir):
+        repo._write_disk_cache(2023, PLAYS.iloc[:0])
+        assert list(disk_cache_dir.iterdir()) == []
+
+    def test_failed_write_keeps_previous_copy(self, repo, disk_cache_dir, monkeypatch):
+        repo._write_disk_cache(2023, PLAYS)
+
+        def partial_write(self, path, **kwargs):
+            Path(path).write_bytes(b'partial')
+            raise OSError("disk full")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(pd.DataFrame, 'to_parquet', partial_write)
+            repo._write_disk_cache(2023, PLAYS.iloc[:1])
+
+        pd.testing.assert_frame_equal(repo._read_disk_cache(2023), PLAYS)
+        assert [path.name for path in disk_cache_dir.iterdir()] == ['pbp_2023.parquet']
+
+    def test_unreadable_copy_is_ignored(self, repo):
+        path = repo._disk_cache_path(2023)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b'not parquet')
+        assert repo._read_disk_cache(2023) is None
+
+
+class TestClearDiskCache:
+    """Test deleting local copies."""
+
+    def test_clear_one_season(self, repo):
+        repo._write_disk_cache(2022, PLAYS)
+        repo._write_disk_cache(2023, PLAYS)
+        assert repo.clear_disk_cache(2023) == 1
+        assert not repo._disk_cache_path(2023).exists()
+        assert repo._disk_cache_path(2022).exists()
+
+    def test_clear_all_seasons(self, repo, disk_cache_dir):
+        repo._write_disk_cache(2022, PLAYS)
+        repo._write_disk_cache(2023, PLAYS)
+        assert repo.clear_disk_cache() == 2
+        assert list(disk_cache_dir.iterdir()) == []
+
+    def test_clear_without_cache_dir(self, repo, disk_cache_dir, monkeypatch):
+        monkeypatch.setattr(UnifiedNFLRepository, 'DISK_CACHE_DIR', disk_cache_dir / 'missing')
+        assert repo.clear_disk_cache() == 0
+
+
+class TestDiskCacheToggle:
+    """Test that loading honours use_disk_cache."""
+
+    def test_enabled_reuses_local_copy(self, repo, downloads):
+        repo._write_disk_cache(2023, PLAYS)
+        data, timestamp = repo.get_play_by_play_data(2023)
+        assert downloads == []
+        assert len(data) == len(PLAYS)
+        assert timestamp == pd.Timestamp('2023-09-17')
+
+    def test_enabled_saves_download(self, repo, downloads):
+        repo.get_play_by_play_data(2023)
+        assert downloads == [[2023]]
+        assert repo._disk_cache_path(2023).exists()
+
+    def test_disabled_ignores_and_skips_local_copy(self, disk_cache_dir, downloads):
+        UnifiedNFLRepository()._write_disk_cache(2022, PLAYS)
+        repo = UnifiedNFLRepository(use_disk_cache=False)
+        repo.get_play_by_play_data(2022)
+        repo.get_play_by_play_data(2023)
+        assert downloads == [[2022], [2023]]
+        assert not repo._disk_cache_path(2023).exists()
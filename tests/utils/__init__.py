@@ -0,0 +1 @@
+# Empty file to make tests.utils a Python package
\ No newline at end of file
@@ -0,0 +1,154 @@
+# tests/utils/test_ranking_utils.py
+
+"""
+Unit tests for league ranking utilities.
+Checks the vectorized ranking path against a plain sort-based ranking and
+verifies that memoized rankings follow changes in the underlying stats.
+"""
+
+import dataclasses
+import math
+from types import SimpleNamespace
+
+import pytest
+from src.utils.nfl_metrics import LOWER_IS_BETTER_METRICS, RANKING_METRICS
+from src.utils.ranking_utils import (
+    _cached_all_rankings,
+    calculate_all_rankings,
+    calculate_performance_rank,
+    calculate_team_rankings,
+    clear_ranking_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Start every test from an empty ranking cache."""
+    clear_ranking_cache()
+    yield
+    clear_ranking_cache()
+
+
+def _make_stats(**values):
+    """Stats object with every ranking metric, defaulting to 1.0."""
+    fields = {metric: 1.0 for metric in RANKING_METRICS}
+    fields.update(values)
+    return SimpleNamespace(**fields)
+
+
+def _reference_rankings(team_stats_dict):
+    """Straightforward 'min' ranking: 1 + number of teams with a strictly better value."""
+    rankings = {team_abbr: {} for team_abbr in team_stats_dict}
+    for metric in RANKING_METRICS:
+        values = {
+            team_abbr: getattr(stats, metric, None)
+            for team_abbr, stats in team_stats_dict.items()
+        }
+        values = {
+            team_abbr: value for team_abbr, value in values.items()
+            if value is not None and not math.isnan(value)
+        }
+        reverse = metric not in LOWER_IS_BETTER_METRICS
+        ordered = sorted(values.values(), reverse=reverse)
+        for team_abbr, value in values.items():
+            rankings[team_abbr][metric] = ordered.index(value) + 1
+    return rankings
+
+
+@pytest.fixture
+def league():
+    """Small league with ties, missing values and both metric directions."""
+    return {
+        'KC': _make_stats(avg_yards_per_play=6.1, turnovers_per_game=0.8, toer=72.0),
+        'BUF': _make_stats(avg_yards_per_play=5.9, turnovers_per_game=1.2, toer=72.0),
+        'SF': _make_stats(avg_yards_per_play=6.1, turnovers_per_game=0.8, toer=float('nan')),
+        'DET': _make_stats(avg_yards_per_play=5.4, turnovers_per_game=2.0, toer=65.5),
+        'NYJ': _make_stats(avg_yards_per_play=float('nan'), turnovers_per_game=1.2, toer=40.0),
+        'CAR': _make_stats(avg_yards_per_play=4.2, turnovers_per_game=None, toer=38.0),
+    }
+
+
+class TestCalculateAllRankings:
+    """Test league-wide rankings against the reference sort."""
+
+    def test_matches_reference(self, league):
+        assert calculate_all_rankings(league) == _reference_rankings(league)
+
+    def test_ties_share_best_rank(self, league):
+        rankings = calculate_all_rankings(league)
+        assert rankings['KC']['avg_yards_per_play'] == 1
+        assert rankings['SF']['avg_yards_per_play'] == 1
+        assert rankings['BUF']['avg_yards_per_play'] == 3
+        assert rankings['KC']['toer'] == rankings['BUF']['toer'] == 1
+        assert rankings['DET']['toer'] == 3
+
+    def test_lower_is_better_metric(self, league):
+        rankings = calculate_all_rankings(league)
+        assert rankings['KC']['turnovers_per_game'] == 1
+        assert rankings['BUF']['turnovers_per_game'] == 3
+        assert rankings['DET']['turnovers_per_game'] == 5
+
+    def test_missing_values_are_unranked(self, league):
+        rankings = calculate_all_rankings(league)
+        assert 'toer' not in rankings['SF']
+        assert 'avg_yards_per_play' not in rankings['NYJ']
+        assert 'turnovers_per_game' not in rankings['CAR']
+        # Unranked teams do not push anyone else down
+        assert rankings['CAR']['avg_yards_per_play'] == 5
+
+    def test_partial_stats_objects(self):
+        league = {
+            'KC': SimpleNamespace(avg_yards_per_play=6.0),
+            'BUF': SimpleNamespace(avg_yards_per_play=5.0, toer=50.0),
+        }
+        assert calculate_all_rankings(league) == _reference_rankings(league)
+
+    def test_empty_league(self):
+        assert calculate_all_rankings({}) == {}
+
+    def test_results_are_independent_copies(self, league):
+        calculate_all_rankings(league)['KC']['toer'] = 99
+        assert calculate_all_rankings(league)['KC']['toer'] == 1
+
+
+class TestCalculateTeamRankings:
+    """Test single-team rankings."""
+
+    def test_matches_reference(self, league):
+        expected = _reference_rankings(league)
+        for team_abbr in league:
+            assert calculate_team_rankings(team_abbr, league) == expected[team_abbr]
+
+    def test_unknown_team(self, league):
+        assert calculate_team_rankings('XYZ', league) == {}
+
+
+class TestRankingCache:
+    """Test that memoized rankings track the league's stat values."""
+
+    def test_repeat_call_hits_cache(self, league):
+        calculate_all_rankings(league)
+        calculate_team_rankings('KC', league)
+        info = _cached_all_rankings.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_changed_value_is_not_stale(self, league):
+        assert calculate_team_rankings('DET', league)['avg_yards_per_play'] == 4
+        league['DET'].avg_yards_per_play = 7.0
+        rankings = calculate_all_rankings(league)
+        assert rankings['DET']['avg_yards_per_play'] == 1
+        assert rankings['KC']['avg_yards_per_play'] == 2
+        assert rankings == _reference_rankings(league)
+        assert _cached_all_rankings.cache_info().misses == 2
+
+
+class TestPerformanceRank:
+    """Test the shared PerformanceRank objects."""
+
+    def test_full_league_ranks_are_shared_and_frozen(self):
+        rank = calculate_performance_rank(1)
+        assert rank is calculate_performance_rank(1)
+        assert rank.description == "Best in NFL"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            rank.rank = 2